@@ -419,6 +419,7 @@ class MainWindow(QMainWindow):
         self.settings.set('browser', 'bookmarks', self.file_browser.get_bookmarks())
         
         self.settings.save()
+        self.repl.save_history()
         event.accept()
     
     # --- File Operations ---
@@ -0,0 +1,254 @@
+"""
+Bytecode lowering for compiled Forth words.
+
+Colon definitions are compiled as a list of ``(op, arg)`` tuples and word
+names, which is easy to patch while IF/THEN and DO/LOOP are being built
+but slow to run: every step needs an isinstance check and a chain of
+string compares. Before a definition first runs, the interpreter lowers
+it to a flat list of integer opcode/operand pairs:
+
+    [OP_LIT, 5, OP_CALL, ['DUP', None, -1], OP_CALL, ['*', None, -1]]
+
+Branch targets are rewritten to bytecode offsets, and LEAVE gets the
+exit offset of its loop, so the loop no longer scans ahead at run time.
+A CALL's operand is a word reference ``[name, entry, version]`` that the
+interpreter fills in on first use and looks up again only after the
+dictionary's version changes (words stay late-bound).
+
+A peephole pass then marks a few common word pairs (``DUP *``,
+``SWAP DROP``, ``n +``) as superinstructions that run in one dispatch,
+and runs of literals and pure arithmetic (``3 4 +``) are folded into
+their result when CONSTANT_FOLDING is on.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+# Set to False to run every literal and word as written (for debugging)
+CONSTANT_FOLDING = True
+
+# Opcodes (each instruction is two slots: opcode, operand)
+(
+    OP_CALL,      # Execute a word (operand: word reference)
+    OP_LIT,       # Push a number
+    OP_STR,       # Push a string
+    OP_PRINT,     # Print a string (from .")
+    OP_BRANCH,    # Jump to operand
+    OP_0BRANCH,   # Pop flag, jump to operand if zero
+    OP_DO,        # Start a counted loop
+    OP_LOOP,      # Increment index and loop back
+    OP_PLUS_LOOP, # Add n to index and loop back
+    OP_I,         # Push innermost loop index
+    OP_J,         # Push next outer loop index
+    OP_LEAVE,     # Exit loop, jump to operand
+    OP_UNLOOP,    # Discard loop parameters
+    OP_NOP,       # Anything else (e.g. EXIT markers); still a step
+    OP_DUP_MUL,   # DUP * superinstruction (operand: DUP's reference)
+    OP_SWAP_DROP, # SWAP DROP superinstruction (operand: SWAP's reference)
+    OP_LIT_ADD,   # n + superinstruction (operand: n)
+    OP_CONST,     # Folded literal run (operand: see _fold)
+) = range(18)
+
+OP_NAMES = (
+    'CALL', 'LIT', 'STR', 'PRINT', 'BRANCH', '0BRANCH', 'DO', 'LOOP',
+    '+LOOP', 'I', 'J', 'LEAVE', 'UNLOOP', 'NOP', 'DUP*', 'SWAPDROP',
+    'LIT+', 'CONST',
+)
+
+# Internal control flow isn't a visible step, so it never pauses
+_SILENT_OPS = frozenset({OP_BRANCH, OP_0BRANCH, OP_LOOP, OP_LEAVE, OP_UNLOOP})
+OP_PAUSES = tuple(op not in _SILENT_OPS for op in range(len(OP_NAMES)))
+
+# Compiled tuple op name -> opcode
+_TUPLE_OPS = {
+    'LIT': OP_LIT,
+    'STR': OP_STR,
+    'PRINT': OP_PRINT,
+    'BRANCH': OP_BRANCH,
+    '0BRANCH': OP_0BRANCH,
+    'DO': OP_DO,
+    'LOOP': OP_LOOP,
+    '+LOOP': OP_PLUS_LOOP,
+    'I': OP_I,
+    'J': OP_J,
+    'LEAVE': OP_LEAVE,
+    'UNLOOP': OP_UNLOOP,
+}
+
+# Word pairs fused into one superinstruction
+_FUSED_CALLS = {
+    ('DUP', '*'): OP_DUP_MUL,
+    ('SWAP', 'DROP'): OP_SWAP_DROP,
+}
+
+# Pure words that can be folded when all operands are literals -> arity
+_FOLDABLE = {
+    '+': 2, '-': 2, '*': 2, '/': 2, 'MOD': 2, 'MIN': 2, 'MAX': 2,
+    '=': 2, '<>': 2, '<': 2, '>': 2, '<=': 2, '>=': 2,
+    'AND': 2, 'OR': 2, 'XOR': 2, 'LSHIFT': 2, 'RSHIFT': 2,
+    'NEGATE': 1, 'ABS': 1, '1+': 1, '1-': 1, '2+': 1, '2-': 1,
+    '2*': 1, '2/': 1, '0=': 1, '0<': 1, '0>': 1, '0<>': 1,
+    'INVERT': 1, 'NOT': 1,
+}
+
+# Largest shift folded at compile time (bigger ones wait for run time)
+_MAX_FOLD_SHIFT = 64
+
+# Words the superinstructions and folded runs stand in for
+FUSED_WORDS = ('DUP', '*', 'SWAP', 'DROP') + tuple(_FOLDABLE)
+
+
+def _leave_target(code: List, index: int) -> int:
+    """Find the definition index just past the loop a LEAVE exits.
+
+    Args:
+        code: Compiled definition
+        index: Position of the LEAVE
+
+    Returns:
+        Index after the matching LOOP/+LOOP (or the end of the code)
+    """
+    depth = 1
+    ip = index + 1
+    while ip < len(code) and depth > 0:
+        check = code[ip]
+        ip += 1
+        if isinstance(check, tuple):
+            if check[0] == 'DO':
+                depth += 1
+            elif check[0] in ('LOOP', '+LOOP'):
+                depth -= 1
+    return ip
+
+
+def lower(code: List, primitives: Optional[Dict[str, Callable]] = None) -> List[Any]:
+    """Lower a compiled definition to flat bytecode.
+
+    Args:
+        code: Compiled definition (tuples and word names)
+        primitives: Built-in word functions used for constant folding
+            (no folding if omitted)
+
+    Returns:
+        Flat list of alternating opcodes and operands
+    """
+    out: List[Any] = []
+    for index, item in enumerate(code):
+        if isinstance(item, str):
+            out += (OP_CALL, [item, None, -1])
+        elif isinstance(item, tuple):
+            op = _TUPLE_OPS.get(item[0], OP_NOP)
+            arg = item[1] if len(item) > 1 else None
+            if op in (OP_BRANCH, OP_0BRANCH) and arg is not None:
+                arg = 2 * arg
+            elif op == OP_LEAVE:
+                arg = 2 * _leave_target(code, index)
+            out += (op, arg)
+        else:
+            out += (OP_NOP, None)
+    if CONSTANT_FOLDING and primitives:
+        _fold(out, primitives)
+    _fuse(out)
+    return out
+
+
+class _FoldStack:
+    """Just enough of the interpreter to run a pure primitive on literals."""
+
+    def __init__(self, values: List[Any]):
+        self.data_stack = list(values)
+
+    def require(self, n: int, word: str) -> None:
+        if len(self.data_stack) < n:
+            raise IndexError(word)
+
+    def pop(self) -> Any:
+        return self.data_stack.pop()
+
+    def push(self, value: Any) -> None:
+        self.data_stack.append(value)
+
+
+def _fold(out: List[Any], primitives: Dict[str, Callable]) -> None:
+    """Fold runs of literals and pure words into their results, in place.
+
+    Each word is evaluated with the built-in primitive itself, so results
+    (flags, integer division) match a normal run exactly; a word that
+    would raise is left for run time. As with superinstructions, only the
+    first instruction of a run is rewritten:
+
+        OP_CONST, (values, end_ip, words, first_literal)
+
+    so the handler can push ``values`` and jump to ``end_ip``, or fall
+    back to the original literal when the run must be shown step by step.
+
+    Args:
+        out: Flat bytecode from lower()
+        primitives: Built-in word name -> primitive function
+    """
+    ip = 0
+    end = len(out)
+    while ip < end:
+        if out[ip] != OP_LIT:
+            ip += 2
+            continue
+        start = ip
+        values: List[Any] = []
+        words: List[str] = []
+        folded = None  # (values, end_ip, words) at the last folded word
+        while ip < end:
+            op, arg = out[ip], out[ip + 1]
+            if op == OP_LIT:
+                values.append(arg)
+            elif op == OP_CALL and arg[0] in _FOLDABLE and arg[0] in primitives:
+                word = arg[0]
+                arity = _FOLDABLE[word]
+                if arity > len(values):
+                    break
+                operands = values[-arity:]
+                if word in ('LSHIFT', 'RSHIFT') and not (
+                        isinstance(operands[1], int) and 0 <= operands[1] <= _MAX_FOLD_SHIFT):
+                    break
+                scratch = _FoldStack(operands)
+                try:
+                    primitives[word](scratch)
+                except Exception:
+                    break
+                values[-arity:] = scratch.data_stack
+                words.append(word)
+                folded = (tuple(values), ip + 2, tuple(words))
+            else:
+                break
+            ip += 2
+        if folded is None:
+            ip = start + 2
+            continue
+        result, end_ip, used = folded
+        out[start + 1] = (result, end_ip, used, out[start + 1])
+        out[start] = OP_CONST
+        ip = end_ip
+
+
+def _fuse(out: List[Any]) -> None:
+    """Mark fusable instruction pairs as superinstructions, in place.
+
+    Only the first opcode of a pair is rewritten. The second instruction
+    stays where it is, so branch offsets don't move and the handler can
+    fall back to running the pair one word at a time.
+
+    Args:
+        out: Flat bytecode from lower()
+    """
+    ip = 0
+    end = len(out) - 2
+    while ip < end:
+        op, arg, next_op, next_arg = out[ip:ip + 4]
+        fused = None
+        if op == OP_CALL and next_op == OP_CALL:
+            fused = _FUSED_CALLS.get((arg[0], next_arg[0]))
+        elif op == OP_LIT and type(arg) is int and next_op == OP_CALL and next_arg[0] == '+':
+            fused = OP_LIT_ADD
+        if fused is None:
+            ip += 2
+        else:
+            out[ip] = fused
+            ip += 4
@@ -22,6 +22,7 @@ class DictionaryEntry:
         stack_effect: Stack effect notation, e.g., "( n1 n2 -- sum )"
         docstring: Human-readable description of the word
         source_location: Optional (file, line) where word was defined
+        bytecode: Lowered form of a compiled word, built on first run
     """
     name: str
     code: Callable | List
@@ -29,6 +30,7 @@ class DictionaryEntry:
     stack_effect: str = ""
     docstring: str = ""
     source_location: tuple[str, int] | None = None
+    bytecode: List | None = field(default=None, repr=False, compare=False)
     
     def is_primitive(self) -> bool:
         """Check if this is a primitive (Python function) word."""
@@ -47,6 +49,9 @@ class Dictionary:
     
     Word names are stored uppercase for case-insensitive matching.
     
+    ``version`` goes up whenever a word is defined or forgotten, so
+    callers can cache lookups and redo them only after a change.
+    
     Example:
         >>> d = Dictionary()
         >>> d.define(DictionaryEntry(name="+", code=add_fn, stack_effect="( n1 n2 -- sum )"))
@@ -58,6 +63,10 @@ class Dictionary:
     def __init__(self):
         self._entries: dict[str, DictionaryEntry] = {}
         self._order: list[str] = []  # Maintains definition order
+        self.version = 0  # Bumped on every define/forget
+        # find_similar() results, valid while _similar_version == version
+        self._similar_cache: dict[tuple[str, int], List[str]] = {}
+        self._similar_version = 0
     
     def define(self, entry: DictionaryEntry) -> None:
         """Add or redefine a word in the dictionary.
@@ -72,6 +81,7 @@ class Dictionary:
             self._order.append(name_upper)
         
         self._entries[name_upper] = entry
+        self.version += 1
     
     def lookup(self, name: str) -> Optional[DictionaryEntry]:
         """Find a word in the dictionary.
@@ -117,6 +127,7 @@ class Dictionary:
             self._order = self._order[:idx]
             for word in words_to_remove:
                 del self._entries[word]
+            self.version += 1
             return True
         except ValueError:
             return False
@@ -138,7 +149,8 @@ class Dictionary:
     def find_similar(self, name: str, n: int = 3) -> List[str]:
         """Find words similar to the given name.
         
-        Used for "did you mean?" suggestions.
+        Used for "did you mean?" suggestions. Results are cached until the
+        next define/forget, since the same typo tends to come up again.
         
         Args:
             name: Word to find matches for
@@ -147,8 +159,16 @@ class Dictionary:
         Returns:
             List of similar word names
         """
-        name_upper = name.upper()
-        return get_close_matches(name_upper, self._order, n=n, cutoff=0.6)
+        if self._similar_version != self.version:
+            self._similar_cache.clear()
+            self._similar_version = self.version
+        
+        key = (name.upper(), n)
+        matches = self._similar_cache.get(key)
+        if matches is None:
+            matches = get_close_matches(key[0], self._order, n=n, cutoff=0.6)
+            self._similar_cache[key] = matches
+        return list(matches)
     
     def see(self, name: str) -> Optional[str]:
         """Decompile a word definition.
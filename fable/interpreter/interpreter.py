@@ -5,10 +5,12 @@ This module contains the main ForthInterpreter class that executes
 Forth code and emits signals for GUI integration.
 """
 
-from typing import Any, List, Optional, Callable
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QEventLoop
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from PyQt6.QtCore import QObject, QMetaMethod, pyqtSignal, QTimer, QEventLoop
 
-from .lexer import Lexer, Token, TokenType
+from . import bytecode
+from .bytecode import OP_PAUSES
+from .lexer import Lexer, Token, TokenType, tokenize
 from .dictionary import Dictionary, DictionaryEntry
 from .errors import (
     ForthError, StackUnderflowError, UnknownWordError,
@@ -16,6 +18,22 @@ from .errors import (
 )
 
 
+# Source string -> executable tokens (comments and EOF already dropped)
+_compile_cache: Dict[str, Tuple[Token, ...]] = {}
+_COMPILE_CACHE_SIZE = 1024
+_MAX_CACHED_SOURCE = 16_384  # Longer sources (whole files) aren't kept
+
+
+def clear_caches() -> None:
+    """Drop memoized token streams.
+    
+    Cached entries keep their source strings alive, so long-running
+    sessions can call this to release them.
+    """
+    _compile_cache.clear()
+    tokenize.cache_clear()
+
+
 class ForthInterpreter(QObject):
     """Main Forth interpreter with GUI integration signals.
     
@@ -46,6 +64,9 @@ class ForthInterpreter(QObject):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Per-word trace signals are only built and emitted when connected
+        self._trace_starting = False
+        self._trace_complete = False
         self.data_stack: List[Any] = []
         self.return_stack: List[Any] = []
         self.dictionary = Dictionary()
@@ -57,12 +78,52 @@ class ForthInterpreter(QObject):
         self._definition_name: str = ""      # Name of word being defined
         self.delay = 0  # Execution delay in ms
         self.running = False
+        # Output waiting for flush_output() (one emit per batch, not per word)
+        self._output_parts: List[str] = []
         
         # Register primitive words
         
         # Register primitive words
         self._step_event_loop = None
         self._register_primitives()
+        
+        # Bytecode dispatch table, in opcode order
+        self._op_handlers = (
+            self._op_call, self._op_lit, self._op_str, self._op_print,
+            self._op_branch, self._op_0branch, self._op_do, self._op_loop,
+            self._op_plus_loop, self._op_i, self._op_j, self._op_leave,
+            self._op_unloop, self._op_nop, self._op_dup_mul,
+            self._op_swap_drop, self._op_lit_add, self._op_const,
+        )
+        # Built-in entries the superinstructions may stand in for
+        self._fused_entries = {
+            name: self.dictionary.lookup(name) for name in bytecode.FUSED_WORDS
+        }
+        self._fold_primitives = {
+            name: entry.code for name, entry in self._fused_entries.items()
+        }
+        # Fused words still bound to their built-ins, as of _intact_version
+        self._intact_words: frozenset = frozenset()
+        self._intact_version = -1
+    
+    def connectNotify(self, signal: QMetaMethod) -> None:
+        """Note when something starts listening to the trace signals."""
+        super().connectNotify(signal)
+        self._update_trace_flags()
+    
+    def disconnectNotify(self, signal: QMetaMethod) -> None:
+        """Note when the last listener of a trace signal goes away."""
+        super().disconnectNotify(signal)
+        self._update_trace_flags()
+    
+    def _update_trace_flags(self) -> None:
+        """Refresh which per-word signals have receivers.
+        
+        Headless runs (tests, INCLUDE from scripts) skip the signal
+        emission and the stack snapshot each word would otherwise build.
+        """
+        self._trace_starting = self.receivers(self.word_starting) > 0
+        self._trace_complete = self.receivers(self.word_complete) > 0
     
     def _register_primitives(self):
         """Register all built-in primitive words."""
@@ -80,46 +141,70 @@ class ForthInterpreter(QObject):
         """
         try:
             self.running = True
-            tokens = self._lexer.tokenize(source)
+            tokens = _compile_cache.get(source)
+            if tokens is None:
+                tokens = self._compile(source)
 
             for token in tokens:
                 if self.execution_mode == "stop":
                     break
 
-                if token.type == TokenType.EOF:
-                    break
-
-                if token.type == TokenType.COMMENT:
-                    continue  # Skip comments
-
                 try:
                     self._process_token(token)
                 except ForthError as e:
+                    self.flush_output()
                     self.error_occurred.emit(str(e))
                     raise
 
                 # Wait AFTER processing token (so first step shows result)
                 self._wait_for_step()
         finally:
+            self.flush_output()
             self.running = False
     
+    def _compile(self, source: str) -> Tuple[Token, ...]:
+        """Tokenize source for evaluate(), caching short sources.
+        
+        Args:
+            source: Forth source code string
+            
+        Returns:
+            Tokens to execute, without comments or the EOF marker
+        """
+        tokens = []
+        for token in self._lexer.tokenize(source):
+            if token.type is TokenType.EOF:
+                break
+            if token.type is TokenType.COMMENT:
+                continue  # Skip comments
+            tokens.append(token)
+        tokens = tuple(tokens)
+        
+        if len(source) <= _MAX_CACHED_SOURCE:
+            if len(_compile_cache) >= _COMPILE_CACHE_SIZE:
+                _compile_cache.clear()
+            _compile_cache[source] = tokens
+        return tokens
+    
     def _process_token(self, token: Token) -> None:
         """Process a single token.
 
         Args:
             token: The token to process
         """
-        if token.type == TokenType.NUMBER:
+        if token.type is TokenType.NUMBER:
             if self.compiling:
                 self._current_definition.append(('LIT', token.value))
             else:
                 # Emit signals for literal push so stack widget animates
-                self.word_starting.emit(str(token.value), '( -- n )')
+                if self._trace_starting:
+                    self.word_starting.emit(str(token.value), '( -- n )')
                 self.push(token.value)
-                self.word_complete.emit(str(token.value), list(self.data_stack))
+                if self._trace_complete:
+                    self.word_complete.emit(str(token.value), list(self.data_stack))
             return
 
-        if token.type == TokenType.STRING:
+        if token.type is TokenType.STRING:
             if self.compiling:
                 # Check if previous item in compiled code is ." word
                 print_string = (len(self._current_definition) > 0 and
@@ -137,16 +222,18 @@ class ForthInterpreter(QObject):
                 if print_string:
                     self._print_next_string = False
                     # Print immediately
-                    self.output.emit(token.value)
+                    self.emit_output(token.value)
                 else:
                     # Normal string push (for S")
                     # Emit signals for string push so stack widget animates
-                    self.word_starting.emit(f'"{token.value}"', '( -- str )')
+                    if self._trace_starting:
+                        self.word_starting.emit(f'"{token.value}"', '( -- str )')
                     self.push(token.value)
-                    self.word_complete.emit(f'"{token.value}"', list(self.data_stack))
+                    if self._trace_complete:
+                        self.word_complete.emit(f'"{token.value}"', list(self.data_stack))
             return
 
-        if token.type == TokenType.WORD:
+        if token.type is TokenType.WORD:
             self._process_word(token.value)
             return
     
@@ -192,169 +279,244 @@ class ForthInterpreter(QObject):
             entry: The entry to execute
         """
         # Emit signal before execution
-        self.word_starting.emit(entry.name, entry.stack_effect)
+        if self._trace_starting:
+            self.word_starting.emit(entry.name, entry.stack_effect)
         
         if entry.is_primitive():
             # Call the Python function
             entry.code(self)
         else:
-            # Execute compiled code
-            self._execute_compiled(entry.code)
+            # Execute compiled code (lowered to bytecode on first run)
+            if entry.bytecode is None:
+                entry.bytecode = bytecode.lower(entry.code, self._fold_primitives)
+            self._execute_compiled(entry.bytecode)
         
         # Emit signal after execution
         # Emit signal after execution
-        self.word_complete.emit(entry.name, list(self.data_stack))
+        if self._trace_complete:
+            self.word_complete.emit(entry.name, list(self.data_stack))
     
     def set_delay(self, delay_ms: int):
         """Set execution delay in milliseconds."""
         self.delay = delay_ms
     
     def _execute_compiled(self, code: List) -> None:
-        """Execute compiled threaded code with control flow support.
+        """Execute a compiled word's bytecode with control flow support.
+
+        Each opcode indexes straight into the handler table; handlers
+        take the operand, the next instruction pointer and the loop
+        stack, and return where execution continues.
 
         Args:
-            code: List of operations to execute
-
-        Supports:
-            - LIT: Push literal value
-            - STR: Push string value
-            - BRANCH: Unconditional branch (offset)
-            - 0BRANCH: Branch if TOS is 0 (offset)
-            - DO: Start loop (limit, index on stack)
-            - LOOP: Increment and check loop
-            - +LOOP: Add n and check loop
-            - I: Push loop index
-            - J: Push outer loop index
-            - LEAVE: Exit loop early
+            code: Flat opcode/operand list from bytecode.lower()
         """
         ip = 0  # Instruction pointer
+        end = len(code)
         loop_stack = []  # Stack of (limit, index, loop_start_ip)
+        handlers = self._op_handlers
+        pauses = OP_PAUSES
 
-        while ip < len(code):
+        while ip < end:
             if self.execution_mode == "stop":
                 break
 
-            item = code[ip]
-            ip += 1
-
-            # Track if this operation should trigger a step pause
-            should_pause = True
-
-            if isinstance(item, tuple):
-                op = item[0]
-
-                if op == 'LIT':
-                    # Emit signals for literal push animation
-                    self.word_starting.emit(str(item[1]), '( -- n )')
-                    self.push(item[1])
-                    self.word_complete.emit(str(item[1]), list(self.data_stack))
-
-                elif op == 'STR':
-                    # Emit signals for string push animation
-                    self.word_starting.emit(f'"{item[1]}"', '( -- str )')
-                    self.push(item[1])
-                    self.word_complete.emit(f'"{item[1]}"', list(self.data_stack))
-
-                elif op == 'PRINT':
-                    # Print string (from .")
-                    self.output.emit(item[1])
-
-                elif op == 'BRANCH':
-                    # Unconditional branch - no stack change, no signal needed
-                    ip = item[1]
-                    should_pause = False  # Don't pause on internal branching
-
-                elif op == '0BRANCH':
-                    # Branch if top of stack is 0 (false)
-                    flag = self.pop()
-                    if flag == 0:
-                        ip = item[1]
-                    should_pause = False  # Don't pause on internal branching
-
-                elif op == 'DO':
-                    # Start a DO loop: ( limit index -- )
-                    # Emit signal to show DO consuming values and updating return stack
-                    self.word_starting.emit('DO', '( limit index -- )')
-                    index = self.pop()
-                    limit = self.pop()
-                    loop_stack.append((limit, index, ip))
-                    self.word_complete.emit('DO', list(self.data_stack))
-
-                elif op == 'LOOP':
-                    # Increment index and check
-                    should_pause = False  # Internal loop control
-                    if loop_stack:
-                        limit, index, loop_start = loop_stack[-1]
-                        index += 1
-                        if index >= limit:
-                            loop_stack.pop()
-                            # Continue past loop
-                        else:
-                            loop_stack[-1] = (limit, index, loop_start)
-                            ip = loop_start
-
-                elif op == '+LOOP':
-                    # Add increment and check
-                    self.word_starting.emit('+LOOP', '( n -- )')
-                    n = self.pop()
-                    self.word_complete.emit('+LOOP', list(self.data_stack))
-                    if loop_stack:
-                        limit, index, loop_start = loop_stack[-1]
-                        index += n
-                        if (n > 0 and index >= limit) or (n < 0 and index <= limit):
-                            loop_stack.pop()
-                        else:
-                            loop_stack[-1] = (limit, index, loop_start)
-                            ip = loop_start
-
-                elif op == 'UNLOOP':
-                    # Discard loop parameters
-                    should_pause = False  # Internal control
-                    if loop_stack:
-                        loop_stack.pop()
-
-                elif op == 'I':
-                    # Push current loop index
-                    if loop_stack:
-                        self.word_starting.emit('I', '( -- n )')
-                        _, index, _ = loop_stack[-1]
-                        self.push(index)
-                        self.word_complete.emit('I', list(self.data_stack))
-
-                elif op == 'J':
-                    # Push outer loop index
-                    if len(loop_stack) >= 2:
-                        self.word_starting.emit('J', '( -- n )')
-                        _, index, _ = loop_stack[-2]
-                        self.push(index)
-                        self.word_complete.emit('J', list(self.data_stack))
-
-                elif op == 'LEAVE':
-                    # Exit current loop
-                    should_pause = False  # Internal control
-                    if loop_stack:
-                        loop_stack.pop()
-                        # Find matching LOOP/+LOOP to skip to
-                        depth = 1
-                        while ip < len(code) and depth > 0:
-                            check = code[ip]
-                            ip += 1
-                            if isinstance(check, tuple):
-                                if check[0] == 'DO':
-                                    depth += 1
-                                elif check[0] in ('LOOP', '+LOOP'):
-                                    depth -= 1
-
-            elif isinstance(item, str):
-                # Word call - _execute_entry already emits signals
-                entry = self.dictionary.lookup(item)
-                if entry:
-                    self._execute_entry(entry)
+            op = code[ip]
+            ip = handlers[op](code[ip + 1], ip + 2, loop_stack)
 
             # Wait AFTER processing operation (so step shows the result)
-            if should_pause:
+            if pauses[op]:
                 self._wait_for_step()
 
+    # --- Bytecode handlers (indexed by opcode, see bytecode.py) ---
+
+    def _op_call(self, ref: List, ip: int, loops: List) -> int:
+        """CALL: execute a word (_execute_entry emits its signals).
+
+        The word reference caches its entry until the dictionary changes.
+        """
+        version = self.dictionary.version
+        if ref[2] != version:
+            ref[1] = self.dictionary.lookup(ref[0])
+            ref[2] = version
+        entry = ref[1]
+        if entry:
+            self._execute_entry(entry)
+        return ip
+
+    def _op_lit(self, value: Any, ip: int, loops: List) -> int:
+        """LIT: push a literal, with signals for the push animation."""
+        if self._trace_starting:
+            self.word_starting.emit(str(value), '( -- n )')
+        self.data_stack.append(value)
+        if self._trace_complete:
+            self.word_complete.emit(str(value), list(self.data_stack))
+        return ip
+
+    def _op_str(self, value: str, ip: int, loops: List) -> int:
+        """STR: push a string, with signals for the push animation."""
+        if self._trace_starting:
+            self.word_starting.emit(f'"{value}"', '( -- str )')
+        self.data_stack.append(value)
+        if self._trace_complete:
+            self.word_complete.emit(f'"{value}"', list(self.data_stack))
+        return ip
+
+    def _op_print(self, text: str, ip: int, loops: List) -> int:
+        """PRINT: print a string (from .")."""
+        self._output_parts.append(text)
+        return ip
+
+    def _op_branch(self, target: int, ip: int, loops: List) -> int:
+        """BRANCH: unconditional jump (no stack change, no signal)."""
+        return target
+
+    def _op_0branch(self, target: int, ip: int, loops: List) -> int:
+        """0BRANCH: jump if the popped flag is 0 (false)."""
+        if self.pop() == 0:
+            return target
+        return ip
+
+    def _op_do(self, arg: Any, ip: int, loops: List) -> int:
+        """DO: start a counted loop ( limit index -- )."""
+        # Emit signal to show DO consuming values and updating return stack
+        if self._trace_starting:
+            self.word_starting.emit('DO', '( limit index -- )')
+        index = self.pop()
+        limit = self.pop()
+        loops.append((limit, index, ip))
+        if self._trace_complete:
+            self.word_complete.emit('DO', list(self.data_stack))
+        return ip
+
+    def _op_loop(self, arg: Any, ip: int, loops: List) -> int:
+        """LOOP: increment the index and branch back until the limit."""
+        if loops:
+            limit, index, loop_start = loops[-1]
+            index += 1
+            if index >= limit:
+                loops.pop()  # Continue past loop
+            else:
+                loops[-1] = (limit, index, loop_start)
+                return loop_start
+        return ip
+
+    def _op_plus_loop(self, arg: Any, ip: int, loops: List) -> int:
+        """+LOOP: add the popped increment and check the limit."""
+        if self._trace_starting:
+            self.word_starting.emit('+LOOP', '( n -- )')
+        n = self.pop()
+        if self._trace_complete:
+            self.word_complete.emit('+LOOP', list(self.data_stack))
+        if loops:
+            limit, index, loop_start = loops[-1]
+            index += n
+            if (n > 0 and index >= limit) or (n < 0 and index <= limit):
+                loops.pop()
+            else:
+                loops[-1] = (limit, index, loop_start)
+                return loop_start
+        return ip
+
+    def _op_i(self, arg: Any, ip: int, loops: List) -> int:
+        """I: push the current loop index."""
+        if loops:
+            if self._trace_starting:
+                self.word_starting.emit('I', '( -- n )')
+            self.data_stack.append(loops[-1][1])
+            if self._trace_complete:
+                self.word_complete.emit('I', list(self.data_stack))
+        return ip
+
+    def _op_j(self, arg: Any, ip: int, loops: List) -> int:
+        """J: push the outer loop index."""
+        if len(loops) >= 2:
+            if self._trace_starting:
+                self.word_starting.emit('J', '( -- n )')
+            self.data_stack.append(loops[-2][1])
+            if self._trace_complete:
+                self.word_complete.emit('J', list(self.data_stack))
+        return ip
+
+    def _op_leave(self, target: int, ip: int, loops: List) -> int:
+        """LEAVE: exit the loop (target precomputed past its LOOP/+LOOP)."""
+        if loops:
+            loops.pop()
+            return target
+        return ip
+
+    def _op_unloop(self, arg: Any, ip: int, loops: List) -> int:
+        """UNLOOP: discard the innermost loop parameters."""
+        if loops:
+            loops.pop()
+        return ip
+
+    def _op_nop(self, arg: Any, ip: int, loops: List) -> int:
+        """NOP: markers with no runtime effect (still a step)."""
+        return ip
+
+    def _can_fuse(self, *words: str) -> bool:
+        """Check whether a superinstruction may skip its separate steps.
+
+        Fusing is only invisible when nothing is tracing words, there is
+        no per-step pause, and both words are still the built-ins.
+
+        Args:
+            words: Words the superinstruction stands in for
+
+        Returns:
+            True if the words can run as one step
+        """
+        if self._trace_starting or self._trace_complete:
+            return False
+        if self.execution_mode != "run" or self.delay > 0:
+            return False
+        if self._intact_version != self.dictionary.version:
+            lookup = self.dictionary.lookup
+            self._intact_words = frozenset(
+                name for name, entry in self._fused_entries.items()
+                if lookup(name) is entry
+            )
+            self._intact_version = self.dictionary.version
+        return self._intact_words.issuperset(words)
+
+    def _op_dup_mul(self, ref: List, ip: int, loops: List) -> int:
+        """DUP *: square the top of stack in one step."""
+        stack = self.data_stack
+        if stack and self._can_fuse('DUP', '*'):
+            # Pop before computing, like '*', so a TypeError leaves
+            # the same stack as the unfused pair
+            x = stack.pop()
+            stack.append(x * x)
+            return ip + 2  # Skip the '*' that follows
+        # Run DUP alone; the '*' after it runs as its own step
+        return self._op_call(ref, ip, loops)
+
+    def _op_swap_drop(self, ref: List, ip: int, loops: List) -> int:
+        """SWAP DROP: remove the second item in one step."""
+        stack = self.data_stack
+        if len(stack) >= 2 and self._can_fuse('SWAP', 'DROP'):
+            del stack[-2]
+            return ip + 2  # Skip the DROP that follows
+        return self._op_call(ref, ip, loops)
+
+    def _op_lit_add(self, value: int, ip: int, loops: List) -> int:
+        """n +: add a literal to the top of stack in one step."""
+        stack = self.data_stack
+        if stack and self._can_fuse('+'):
+            # Pop first, as '+' does (see _op_dup_mul)
+            stack.append(stack.pop() + value)
+            return ip + 2  # Skip the '+' that follows
+        return self._op_lit(value, ip, loops)
+
+    def _op_const(self, folded: Tuple, ip: int, loops: List) -> int:
+        """CONST: push the result of a constant-folded literal run."""
+        values, end_ip, words, first = folded
+        if self._can_fuse(*words):
+            self.data_stack.extend(values)
+            return end_ip
+        # Run the literals and words as written, starting with the first
+        return self._op_lit(first, ip, loops)
+
     def _start_definition(self) -> None:
         """Start a new colon definition."""
         self.compiling = True
@@ -396,9 +558,10 @@ class ForthInterpreter(QObject):
         Raises:
             StackUnderflowError: If stack is empty
         """
-        if not self.data_stack:
-            raise StackUnderflowError("POP", 1, 0)
-        return self.data_stack.pop()
+        try:
+            return self.data_stack.pop()
+        except IndexError:
+            raise StackUnderflowError("POP", 1, 0) from None
     
     def peek(self, index: int = 0) -> Any:
         """Peek at a stack value without removing it.
@@ -412,9 +575,10 @@ class ForthInterpreter(QObject):
         Raises:
             StackUnderflowError: If index is out of range
         """
-        if index >= len(self.data_stack):
-            raise StackUnderflowError("PEEK", index + 1, len(self.data_stack))
-        return self.data_stack[-(index + 1)]
+        try:
+            return self.data_stack[-(index + 1)]
+        except IndexError:
+            raise StackUnderflowError("PEEK", index + 1, len(self.data_stack)) from None
     
     def depth(self) -> int:
         """Return the current stack depth."""
@@ -461,10 +625,21 @@ class ForthInterpreter(QObject):
     def emit_output(self, text: str) -> None:
         """Emit output text.
         
+        Text is buffered and sent as one output signal by flush_output(),
+        which runs before errors, before any visible pause, and when
+        evaluate() returns.
+        
         Args:
             text: Text to output
         """
-        self.output.emit(text)
+        self._output_parts.append(text)
+    
+    def flush_output(self) -> None:
+        """Send buffered output text to listeners."""
+        if self._output_parts:
+            text = ''.join(self._output_parts)
+            self._output_parts.clear()
+            self.output.emit(text)
     
     # --- State Management ---
     
@@ -495,11 +670,13 @@ class ForthInterpreter(QObject):
             return
 
         if self.execution_mode == "step":
+            self.flush_output()
             self._step_event_loop = QEventLoop()
             self._step_event_loop.exec()
             self._step_event_loop = None
             
         elif self.delay > 0 and self.execution_mode == "run":
+            self.flush_output()
             loop = QEventLoop()
             QTimer.singleShot(self.delay, loop.quit)
             loop.exec()
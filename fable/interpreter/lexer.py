@@ -5,12 +5,14 @@ Forth has a simple syntax: whitespace-separated words with special handling
 for strings and comments. This lexer preserves source location for error reporting.
 """
 
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import List, Iterator, Optional
+import re
+from bisect import bisect_right
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import Any, List, Iterator, NamedTuple, Optional, Tuple
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
     """Types of tokens in Forth source code."""
     WORD = auto()       # Any word (command, number to be parsed later)
     NUMBER = auto()     # Parsed integer or float
@@ -19,10 +21,12 @@ class TokenType(Enum):
     EOF = auto()        # End of file
 
 
-@dataclass
-class Token:
+class Token(NamedTuple):
     """A single token from Forth source code.
     
+    A NamedTuple rather than a dataclass: tokens are never modified, and
+    tuples are smaller and quicker to build and read.
+    
     Attributes:
         type: The token type
         value: The token's value (string for WORD, parsed for NUMBER)
@@ -31,7 +35,7 @@ class Token:
         raw: Original source text
     """
     type: TokenType
-    value: any
+    value: Any
     line: int
     column: int
     raw: str = ""
@@ -40,6 +44,27 @@ class Token:
         return f"Token({self.type.name}, {self.value!r}, {self.line}:{self.column})"
 
 
+# A whitespace-delimited word (Forth whitespace is space, tab, CR, LF)
+_WORD = re.compile(r'[^ \t\n\r]+')
+
+# Parens inside a ( ... ) comment
+_PARENS = re.compile(r'[()]')
+
+# ASCII characters a number can start with (non-ASCII and whitespace are
+# left to int()/float(), which accept Unicode digits and strip spaces)
+_NUMBER_START = frozenset("+-.0123456789$")
+
+# Words without a digit that float() accepts (any case)
+_FLOAT_NAMES = frozenset({'inf', 'infinity', 'nan'})
+
+# Words that read a string: word -> (terminator, skip one space, raw format)
+_STRING_WORDS = {
+    '."': ('"', True, '"{}"'),
+    '.(': (')', False, '({})'),
+    'S"': ('"', True, '"{}"'),
+}
+
+
 class Lexer:
     """Tokenizes Forth source code.
     
@@ -60,14 +85,16 @@ class Lexer:
     
     def __init__(self):
         self._source = ""
-        self._pos = 0
-        self._line = 1
-        self._column = 1
+        self._line_starts: List[int] = [0]
         self._tokens: List[Token] = []
     
     def tokenize(self, source: str) -> List[Token]:
         """Tokenize Forth source code.
         
+        Words are found with a compiled regex and comments/strings with
+        str.find, so the scan runs in C rather than one Python step per
+        character. Line and column come from a bisect over line starts.
+        
         Args:
             source: The source code string
             
@@ -75,127 +102,84 @@ class Lexer:
             List of tokens, ending with EOF token
         """
         self._source = source
-        self._pos = 0
-        self._line = 1
-        self._column = 1
         self._tokens = []
+        # Offsets where each line begins (for line/column lookup)
+        self._line_starts = [0]
+        newline = source.find('\n')
+        while newline != -1:
+            self._line_starts.append(newline + 1)
+            newline = source.find('\n', newline + 1)
         
-        while not self._at_end():
-            self._scan_token()
+        pos = 0
+        end = len(source)
+        while pos < end:
+            match = _WORD.search(source, pos)
+            if match is None:
+                pos = end
+                break
+            pos = self._scan_token(match)
         
         # Add EOF token
-        self._tokens.append(Token(TokenType.EOF, None, self._line, self._column))
+        line, column = self._location(end)
+        self._tokens.append(Token(TokenType.EOF, None, line, column))
         return self._tokens
     
-    def _at_end(self) -> bool:
-        """Check if we've reached the end of source."""
-        return self._pos >= len(self._source)
-    
-    def _peek(self) -> str:
-        """Look at current character without advancing."""
-        if self._at_end():
-            return '\0'
-        return self._source[self._pos]
-    
-    def _peek_next(self) -> str:
-        """Look at next character without advancing."""
-        if self._pos + 1 >= len(self._source):
-            return '\0'
-        return self._source[self._pos + 1]
+    def _location(self, pos: int) -> Tuple[int, int]:
+        """Get the (line, column) of a source offset, both 1-indexed."""
+        line = bisect_right(self._line_starts, pos)
+        return line, pos - self._line_starts[line - 1] + 1
     
-    def _advance(self) -> str:
-        """Consume and return current character."""
-        char = self._source[self._pos]
-        self._pos += 1
-        if char == '\n':
-            self._line += 1
-            self._column = 1
-        else:
-            self._column += 1
-        return char
-    
-    def _skip_whitespace(self):
-        """Skip whitespace characters."""
-        while not self._at_end() and self._peek() in ' \t\n\r':
-            self._advance()
-    
-    def _scan_token(self):
-        """Scan and add the next token."""
-        self._skip_whitespace()
-        
-        if self._at_end():
-            return
+    def _scan_token(self, match: 're.Match') -> int:
+        """Add the token(s) starting at a word match.
         
-        start_line = self._line
-        start_column = self._column
-        start_pos = self._pos
-        
-        char = self._peek()
+        Args:
+            match: Regex match of the next whitespace-delimited word
+            
+        Returns:
+            Source offset to continue scanning from
+        """
+        source = self._source
+        start = match.start()
+        start_line, start_column = self._location(start)
+        word = match.group()
+        char = word[0]
         
         # Line comment: \ to end of line
         if char == '\\':
-            self._scan_line_comment(start_line, start_column)
-            return
+            return self._scan_line_comment(start, start_line, start_column)
         
         # Parenthetical comment: ( ... )
         if char == '(':
             # Check if followed by space (Forth comment convention)
-            if self._peek_next() in ' \t\n':
-                self._scan_paren_comment(start_line, start_column)
-                return
+            if source[start + 1:start + 2] in (' ', '\t', '\n'):
+                return self._scan_paren_comment(start, start_line, start_column)
         
         # String literal: ." ..." or S" ..." or .(
-        # These are handled specially because they're words followed by string
-        
-        # Default: scan a word
-        word = self._scan_word()
-        
-        if not word:
-            return
-        
-        # Check for special words that consume following content
+        # These are words followed by string content up to a terminator
         upper_word = word.upper()
-        
-        # ." prints a string (compile time)
-        if upper_word == '."':
-            self._skip_one_space()
-            string_val = self._scan_string_until('"')
-            self._tokens.append(Token(
-                TokenType.WORD, '."',
-                start_line, start_column, '."'
-            ))
-            self._tokens.append(Token(
-                TokenType.STRING, string_val,
-                self._line, self._column, f'"{string_val}"'
-            ))
-            return
-        
-        # .( prints a string (immediate)
-        if upper_word == '.(': 
-            string_val = self._scan_string_until(')')
-            self._tokens.append(Token(
-                TokenType.WORD, '.(',
-                start_line, start_column, '.('
-            ))
-            self._tokens.append(Token(
-                TokenType.STRING, string_val,
-                self._line, self._column, f'({string_val})'
-            ))
-            return
-        
-        # S" creates a string
-        if upper_word == 'S"':
-            self._skip_one_space()
-            string_val = self._scan_string_until('"')
+        string_word = _STRING_WORDS.get(upper_word)
+        if string_word is not None:
+            terminator, skip_space, raw_format = string_word
+            pos = match.end()
+            if skip_space and source[pos:pos + 1] == ' ':
+                pos += 1
+            close = source.find(terminator, pos)
+            if close == -1:
+                string_val = source[pos:]
+                pos = len(source)
+            else:
+                string_val = source[pos:close]
+                pos = close + 1
+            line, column = self._location(pos)
             self._tokens.append(Token(
-                TokenType.WORD, 'S"',
-                start_line, start_column, 'S"'
+                TokenType.WORD, upper_word,
+                start_line, start_column, upper_word
             ))
             self._tokens.append(Token(
                 TokenType.STRING, string_val,
-                self._line, self._column, f'"{string_val}"'
+                line, column, raw_format.format(string_val)
             ))
-            return
+            return pos
         
         # Try to parse as number
         number = self._try_parse_number(word)
@@ -204,65 +188,48 @@ class Lexer:
                 TokenType.NUMBER, number,
                 start_line, start_column, word
             ))
-            return
+            return match.end()
         
         # It's a word
         self._tokens.append(Token(
             TokenType.WORD, word,
             start_line, start_column, word
         ))
+        return match.end()
     
-    def _scan_word(self) -> str:
-        """Scan a whitespace-delimited word."""
-        chars = []
-        while not self._at_end() and self._peek() not in ' \t\n\r':
-            chars.append(self._advance())
-        return ''.join(chars)
-    
-    def _scan_line_comment(self, start_line: int, start_column: int):
+    def _scan_line_comment(self, start: int, start_line: int, start_column: int) -> int:
         r"""Scan a line comment (\ to end of line)."""
-        chars = []
-        while not self._at_end() and self._peek() != '\n':
-            chars.append(self._advance())
-        # Don't consume the newline, let skip_whitespace handle it
+        # Don't consume the newline, the next word search skips it
+        end = self._source.find('\n', start)
+        if end == -1:
+            end = len(self._source)
+        text = self._source[start:end]
         self._tokens.append(Token(
-            TokenType.COMMENT, ''.join(chars),
-            start_line, start_column, ''.join(chars)
+            TokenType.COMMENT, text,
+            start_line, start_column, text
         ))
+        return end
     
-    def _scan_paren_comment(self, start_line: int, start_column: int):
-        """Scan a parenthetical comment ( ... )."""
-        chars = []
-        self._advance()  # consume (
+    def _scan_paren_comment(self, start: int, start_line: int, start_column: int) -> int:
+        """Scan a parenthetical comment ( ... ), which may nest."""
+        source = self._source
         depth = 1
-        while not self._at_end() and depth > 0:
-            char = self._advance()
-            if char == '(':
+        end = len(source)
+        for paren in _PARENS.finditer(source, start + 1):
+            if paren.group() == '(':
                 depth += 1
-            elif char == ')':
+            else:
                 depth -= 1
                 if depth == 0:
+                    end = paren.start()
                     break
-            chars.append(char)
+        text = source[start + 1:end]
         self._tokens.append(Token(
-            TokenType.COMMENT, ''.join(chars),
-            start_line, start_column, '(' + ''.join(chars) + ')'
+            TokenType.COMMENT, text,
+            start_line, start_column, '(' + text + ')'
         ))
-    
-    def _skip_one_space(self):
-        """Skip exactly one space after ." or S\" words."""
-        if not self._at_end() and self._peek() == ' ':
-            self._advance()
-    
-    def _scan_string_until(self, terminator: str) -> str:
-        """Scan string content until terminator character."""
-        chars = []
-        while not self._at_end():
-            char = self._advance()
-            if char == terminator:
-                break
-            chars.append(char)
-        return ''.join(chars)
+        # Continue after the closing paren (or at the end if unclosed)
+        return min(end + 1, len(source))
     
     def _try_parse_number(self, word: str) -> Optional[int | float]:
         """Try to parse a word as a number.
@@ -279,6 +246,15 @@ class Lexer:
         if not word:
             return None
         
+        # Most words aren't numbers: reject them without raising
+        first = word[0]
+        if first.isascii() and first not in _NUMBER_START and not first.isspace():
+            if first not in 'iInN':
+                return None
+            # inf/nan: leave anything that could still be one to float()
+            if word.isalpha() and word.lower() not in _FLOAT_NAMES:
+                return None
+        
         # Hex with $ prefix (Forth convention)
         if word.startswith('$'):
             try:
@@ -308,13 +284,17 @@ class Lexer:
         return None
 
 
-def tokenize(source: str) -> List[Token]:
+@lru_cache(maxsize=4096)
+def tokenize(source: str) -> Tuple[Token, ...]:
     """Convenience function to tokenize source code.
     
+    Results are memoized by source string, so repeated calls share the
+    same Token objects; treat them as read-only.
+    
     Args:
         source: Forth source code
         
     Returns:
-        List of tokens
+        Tuple of tokens
     """
-    return Lexer().tokenize(source)
+    return tuple(Lexer().tokenize(source))
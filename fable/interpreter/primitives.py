@@ -49,91 +49,71 @@ def _register_stack_words(interp: 'ForthInterpreter') -> None:
     def word_dup(i: 'ForthInterpreter'):
         """( n -- n n ) Duplicate top of stack."""
         i.require(1, 'DUP')
-        i.push(i.peek(0))
+        s = i.data_stack
+        s.append(s[-1])
     
     def word_drop(i: 'ForthInterpreter'):
         """( n -- ) Discard top of stack."""
         i.require(1, 'DROP')
-        i.pop()
+        i.data_stack.pop()
     
     def word_swap(i: 'ForthInterpreter'):
         """( n1 n2 -- n2 n1 ) Exchange top two items."""
         i.require(2, 'SWAP')
-        a = i.pop()
-        b = i.pop()
-        i.push(a)
-        i.push(b)
+        s = i.data_stack
+        s[-1], s[-2] = s[-2], s[-1]
     
     def word_over(i: 'ForthInterpreter'):
         """( n1 n2 -- n1 n2 n1 ) Copy second item to top."""
         i.require(2, 'OVER')
-        i.push(i.peek(1))
+        s = i.data_stack
+        s.append(s[-2])
     
     def word_rot(i: 'ForthInterpreter'):
         """( n1 n2 n3 -- n2 n3 n1 ) Rotate third item to top."""
         i.require(3, 'ROT')
-        c = i.pop()  # n3
-        b = i.pop()  # n2
-        a = i.pop()  # n1
-        i.push(b)    # n2
-        i.push(c)    # n3
-        i.push(a)    # n1
+        s = i.data_stack
+        s.append(s.pop(-3))  # n1 to top
     
     def word_nrot(i: 'ForthInterpreter'):
         """( n1 n2 n3 -- n3 n1 n2 ) Rotate top to third position."""
         i.require(3, '-ROT')
-        c = i.pop()  # n3
-        b = i.pop()  # n2
-        a = i.pop()  # n1
-        i.push(c)    # n3
-        i.push(a)    # n1
-        i.push(b)    # n2
+        s = i.data_stack
+        s.insert(-2, s.pop())  # n3 below n1
     
     def word_nip(i: 'ForthInterpreter'):
         """( n1 n2 -- n2 ) Drop second item."""
         i.require(2, 'NIP')
-        a = i.pop()
-        i.pop()
-        i.push(a)
+        del i.data_stack[-2]
     
     def word_tuck(i: 'ForthInterpreter'):
         """( n1 n2 -- n2 n1 n2 ) Copy top below second."""
         i.require(2, 'TUCK')
-        a = i.pop()
-        b = i.pop()
-        i.push(a)
-        i.push(b)
-        i.push(a)
+        s = i.data_stack
+        s.insert(-2, s[-1])
     
     def word_2dup(i: 'ForthInterpreter'):
         """( n1 n2 -- n1 n2 n1 n2 ) Duplicate top pair."""
         i.require(2, '2DUP')
-        i.push(i.peek(1))
-        i.push(i.peek(1))
+        s = i.data_stack
+        s += s[-2:]
     
     def word_2drop(i: 'ForthInterpreter'):
         """( n1 n2 -- ) Drop top pair."""
         i.require(2, '2DROP')
-        i.pop()
-        i.pop()
+        del i.data_stack[-2:]
     
     def word_2swap(i: 'ForthInterpreter'):
         """( n1 n2 n3 n4 -- n3 n4 n1 n2 ) Swap pairs."""
         i.require(4, '2SWAP')
-        d = i.pop()
-        c = i.pop()
-        b = i.pop()
-        a = i.pop()
-        i.push(c)
-        i.push(d)
-        i.push(a)
-        i.push(b)
+        s = i.data_stack
+        s[-4:] = s[-2:] + s[-4:-2]
     
     def word_2over(i: 'ForthInterpreter'):
         """( n1 n2 n3 n4 -- n1 n2 n3 n4 n1 n2 ) Copy second pair."""
         i.require(4, '2OVER')
-        i.push(i.peek(3))
-        i.push(i.peek(3))
+        s = i.data_stack
+        s += s[-4:-2]
     
     def word_depth(i: 'ForthInterpreter'):
         """( -- n ) Push current stack depth."""
@@ -272,12 +252,14 @@ def _register_arithmetic_words(interp: 'ForthInterpreter') -> None:
     def word_negate(i: 'ForthInterpreter'):
         """( n -- -n ) Negate."""
         i.require(1, 'NEGATE')
-        i.push(-i.pop())
+        s = i.data_stack
+        s.append(-s.pop())
     
     def word_abs(i: 'ForthInterpreter'):
         """( n -- |n| ) Absolute value."""
         i.require(1, 'ABS')
-        i.push(abs(i.pop()))
+        s = i.data_stack
+        s.append(abs(s.pop()))
     
     def word_min(i: 'ForthInterpreter'):
         """( n1 n2 -- min ) Minimum."""
@@ -296,12 +278,14 @@ def _register_arithmetic_words(interp: 'ForthInterpreter') -> None:
     def word_1plus(i: 'ForthInterpreter'):
         """( n -- n+1 ) Increment."""
         i.require(1, '1+')
-        i.push(i.pop() + 1)
+        s = i.data_stack
+        s.append(s.pop() + 1)
     
     def word_1minus(i: 'ForthInterpreter'):
         """( n -- n-1 ) Decrement."""
         i.require(1, '1-')
-        i.push(i.pop() - 1)
+        s = i.data_stack
+        s.append(s.pop() - 1)
     
     def word_2plus(i: 'ForthInterpreter'):
         """( n -- n+2 ) Add two."""
@@ -791,7 +775,7 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
         filename = i.pop()
 
         if not isinstance(filename, str):
-            i.output.emit(f"Error: INCLUDE expects a string filename, got {type(filename).__name__}\n")
+            i.emit_output(f"Error: INCLUDE expects a string filename, got {type(filename).__name__}\n")
             return
 
         # Search paths for libraries
@@ -819,9 +803,9 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
                 break
 
         if not file_path:
-            i.output.emit(f"Error: Library file '{filename}' not found in search paths:\n")
+            i.emit_output(f"Error: Library file '{filename}' not found in search paths:\n")
             for path in search_paths:
-                i.output.emit(f"  - {path}\n")
+                i.emit_output(f"  - {path}\n")
             return
 
         # Check if already loaded (prevent double-loading)
@@ -830,7 +814,7 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
 
         file_path_str = str(file_path.resolve())
         if file_path_str in i._loaded_libraries:
-            i.output.emit(f"Library '{filename}' already loaded.\n")
+            i.emit_output(f"Library '{filename}' already loaded.\n")
             return
 
         # Load and execute the file
@@ -838,16 +822,16 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
             with open(file_path, 'r', encoding='utf-8') as f:
                 source = f.read()
 
-            i.output.emit(f"Loading library: {filename}\n")
+            i.emit_output(f"Loading library: {filename}\n")
             i._loaded_libraries.add(file_path_str)
 
             # Execute the library code
             i.evaluate(source)
 
-            i.output.emit(f"Library '{filename}' loaded successfully.\n")
+            i.emit_output(f"Library '{filename}' loaded successfully.\n")
 
         except Exception as e:
-            i.output.emit(f"Error loading library '{filename}': {e}\n")
+            i.emit_output(f"Error loading library '{filename}': {e}\n")
             # Remove from loaded set if it failed
             i._loaded_libraries.discard(file_path_str)
 
@@ -863,7 +847,7 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
         filename = i.pop()
 
         if not isinstance(filename, str):
-            i.output.emit(f"Error: SAVE-LIBRARY expects a string filename, got {type(filename).__name__}\n")
+            i.emit_output(f"Error: SAVE-LIBRARY expects a string filename, got {type(filename).__name__}\n")
             return
 
         # Ensure .fth extension
@@ -884,7 +868,7 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
                 user_words.append((word_name, entry))
 
         if not user_words:
-            i.output.emit("No user-defined words to save.\n")
+            i.emit_output("No user-defined words to save.\n")
             return
 
         # Generate library file content
@@ -906,43 +890,43 @@ def _register_file_words(interp: 'ForthInterpreter') -> None:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write('\n'.join(lines))
 
-            i.output.emit(f"Saved {len(user_words)} word(s) to: {file_path}\n")
+            i.emit_output(f"Saved {len(user_words)} word(s) to: {file_path}\n")
 
         except Exception as e:
-            i.output.emit(f"Error saving library: {e}\n")
+            i.emit_output(f"Error saving library: {e}\n")
 
     def word_loaded_libraries(i: 'ForthInterpreter'):
         """LOADED-LIBRARIES - List all loaded library files."""
         if not hasattr(i, '_loaded_libraries') or not i._loaded_libraries:
-            i.output.emit("No libraries loaded.\n")
+            i.emit_output("No libraries loaded.\n")
             return
 
-        i.output.emit("Loaded libraries:\n")
+        i.emit_output("Loaded libraries:\n")
         for lib_path in sorted(i._loaded_libraries):
-            i.output.emit(f"  {Path(lib_path).name}\n")
+            i.emit_output(f"  {Path(lib_path).name}\n")
 
     def word_library_path(i: 'ForthInterpreter'):
         """LIBRARY-PATH - Show library search paths."""
-        i.output.emit("Library search paths:\n")
+        i.emit_output("Library search paths:\n")
 
         # Current directory
-        i.output.emit(f"  1. {Path.cwd()}\n")
+        i.emit_output(f"  1. {Path.cwd()}\n")
 
         # User libraries
         user_lib_dir = Path.home() / '.config' / 'fable' / 'libraries'
-        i.output.emit(f"  2. {user_lib_dir}")
+        i.emit_output(f"  2. {user_lib_dir}")
         if user_lib_dir.exists():
-            i.output.emit(" ✓\n")
+            i.emit_output(" ✓\n")
         else:
-            i.output.emit(" (not created yet)\n")
+            i.emit_output(" (not created yet)\n")
 
         # Bundled libraries
         bundled_lib_dir = Path(__file__).parent.parent.parent / 'libraries'
-        i.output.emit(f"  3. {bundled_lib_dir}")
+        i.emit_output(f"  3. {bundled_lib_dir}")
         if bundled_lib_dir.exists():
-            i.output.emit(" ✓\n")
+            i.emit_output(" ✓\n")
         else:
-            i.output.emit(" (not found)\n")
+            i.emit_output(" (not found)\n")
 
     # Register file I/O words
     words = [
@@ -7,37 +7,128 @@ from pathlib import Path
 import os
 import shutil
 
-from PyQt6.QtCore import Qt, pyqtSignal, QDir
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QDir, QModelIndex, QObject, QRunnable, QThreadPool
+)
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTreeView,
     QLabel, QHBoxLayout, QMenu, QInputDialog,
-    QMessageBox, QLineEdit
+    QMessageBox, QLineEdit, QFileIconProvider
 )
 from PyQt6.QtGui import QFont, QFileSystemModel, QAction, QIcon
 from fable.utils.settings import Settings
 
 
+# Icon shown next to Forth source files
+_FORTH_ICON_PATH = (
+    Path(__file__).parent.parent / 'resources' / 'icons'
+    / 'fable_forth_aligned_256x256.png'
+)
+
+
 class ForthFileSystemModel(QFileSystemModel):
     """File system model with Forth file type awareness."""
     
     # Forth file extensions
-    FORTH_EXTENSIONS = {'.fs', '.fth', '.4th', '.forth', '.f'}
+    FORTH_EXTENSIONS = frozenset({'.fs', '.fth', '.4th', '.forth', '.f'})
+    
+    # Name filters derived once from FORTH_EXTENSIONS
+    _FORTH_NAME_FILTERS = sorted(f"*{ext}" for ext in FORTH_EXTENSIONS)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         # Show all files but can filter to Forth files
         self._show_all_files = True
+        # Hide non-matching files instead of drawing them disabled
+        self.setNameFilterDisables(False)
+        
+        # Icons are resolved once here; data() hands them out per row
+        provider = QFileIconProvider()
+        self._folder_icon = provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = provider.icon(QFileIconProvider.IconType.File)
+        self._forth_icon = QIcon(str(_FORTH_ICON_PATH))
+        if self._forth_icon.isNull():
+            self._forth_icon = self._file_icon
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return cached icons for the decoration role.
+        
+        Avoids a QFileIconProvider (and icon theme) lookup for every
+        visible row; all other roles go to QFileSystemModel.
+        """
+        if role == Qt.ItemDataRole.DecorationRole and index.column() == 0:
+            if self.isDir(index):
+                return self._folder_icon
+            ext = os.path.splitext(self.fileName(index))[1].lower()
+            if ext in self.FORTH_EXTENSIONS:
+                return self._forth_icon
+            return self._file_icon
+        return super().data(index, role)
     
     def setShowAllFiles(self, show_all: bool):
         """Toggle between showing all files or just Forth files."""
         self._show_all_files = show_all
+        # Only Forth-only mode has filters to hide by
+        self.setNameFilterDisables(show_all)
         self.setNameFilters(self._get_filters())
     
     def _get_filters(self):
         """Get name filters based on current mode."""
         if self._show_all_files:
             return []
-        return ['*.fs', '*.fth', '*.4th', '*.forth', '*.f']
+        return self._FORTH_NAME_FILTERS
+
+
+# Device names Windows refuses as file names, with or without an extension
+_RESERVED_NAMES = frozenset(
+    {'CON', 'PRN', 'AUX', 'NUL'}
+    | {f'COM{n}' for n in range(1, 10)}
+    | {f'LPT{n}' for n in range(1, 10)}
+)
+
+
+def _validate_name(name: str) -> str | None:
+    """Check a new file/folder name before touching the disk.
+    
+    Args:
+        name: Name entered by the user
+        
+    Returns:
+        Error message, or None if the name is acceptable
+    """
+    if not name or not name.strip():
+        return "Name cannot be empty."
+    if '/' in name or '\\' in name or '\0' in name:
+        return "Name cannot contain '/', '\\' or NUL characters."
+    if name in ('.', '..'):
+        return f"'{name}' is not a valid name."
+    if name.split('.')[0].upper() in _RESERVED_NAMES:
+        return f"'{name}' is a reserved name."
+    return None
+
+
+class _RmTreeSignals(QObject):
+    """Signals for _RmTreeJob (QRunnable cannot emit signals itself)."""
+    
+    finished = pyqtSignal(str)       # path
+    failed = pyqtSignal(str, str)    # path, error message
+
+
+class _RmTreeJob(QRunnable):
+    """Recursively delete a directory on a thread pool worker."""
+    
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        self.signals = _RmTreeSignals()
+    
+    def run(self):
+        try:
+            shutil.rmtree(self.path, ignore_errors=False)
+        except Exception as e:
+            self.signals.failed.emit(str(self.path), str(e))
+        else:
+            self.signals.finished.emit(str(self.path))
 
 
 class FileBrowser(QWidget):
@@ -68,6 +159,7 @@ class FileBrowser(QWidget):
         self.settings = Settings()
         self._root_path: Path | None = None
         self._bookmarks: list[Path] = []
+        self._delete_jobs: list[_RmTreeJob] = []  # Running folder deletes
         self._setup_ui()
         self._setup_context_menu()
         self._load_settings()
@@ -296,7 +388,7 @@ class FileBrowser(QWidget):
         
         # Enable/disable actions based on selection
         self.action_rename.setEnabled(has_selection)
-        self.action_delete.setEnabled(has_selection)
+        self.action_delete.setEnabled(has_selection and not self._delete_jobs)
         self.action_reveal.setEnabled(has_selection)
         self.action_open_folder.setEnabled(is_dir)
         self.action_go_up.setEnabled(self._root_path is not None and self._root_path.parent != self._root_path)
@@ -315,9 +407,11 @@ class FileBrowser(QWidget):
         )
         
         if ok and name:
-            new_path = parent_path / name
+            new_path = self._check_new_path(parent_path, name)
+            if new_path is None:
+                return
             try:
-                new_path.touch()
+                new_path.touch(exist_ok=False)
                 self.file_created.emit(str(new_path))
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Could not create file:\n{e}")
@@ -334,12 +428,30 @@ class FileBrowser(QWidget):
         )
         
         if ok and name:
-            new_path = parent_path / name
+            new_path = self._check_new_path(parent_path, name)
+            if new_path is None:
+                return
             try:
-                new_path.mkdir(parents=True, exist_ok=True)
+                new_path.mkdir()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Could not create folder:\n{e}")
     
+    def _check_new_path(self, parent_path: Path, name: str) -> Path | None:
+        """Validate a new item name and return its path.
+        
+        Warns the user and returns None if the name is invalid or
+        already taken, so no file system call is made for it.
+        """
+        error = _validate_name(name)
+        if error is None:
+            new_path = parent_path / name
+            if new_path.exists():
+                error = f"'{name}' already exists."
+            else:
+                return new_path
+        QMessageBox.warning(self, "Invalid Name", error)
+        return None
+    
     def _rename_item(self):
         """Rename the selected item."""
         path = self.get_selected_path()
@@ -363,11 +475,12 @@ class FileBrowser(QWidget):
     
     def _delete_item(self):
         """Delete the selected item."""
-        path = self.get_selected_path()
-        if not path:
+        index = self.get_selected_index()
+        if index is None:
             return
         
-        path = Path(path)
+        path = Path(self.model.filePath(index))
+        is_dir = self.model.isDir(index)
         
         reply = QMessageBox.question(
             self, "Delete",
@@ -375,29 +488,71 @@ class FileBrowser(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                if path.is_dir():
-                    shutil.rmtree(path)
-                else:
-                    path.unlink()
-                self.file_deleted.emit(str(path))
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not delete:\n{e}")
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        if is_dir:
+            # Recursive deletes can take a long time - keep the UI responsive
+            self._start_rmtree(path)
+            return
+        
+        try:
+            path.unlink()
+            self.file_deleted.emit(str(path))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not delete:\n{e}")
+    
+    def _start_rmtree(self, path: Path):
+        """Delete a folder tree on the global thread pool."""
+        job = _RmTreeJob(path)
+        job.setAutoDelete(False)
+        job.signals.finished.connect(lambda p, j=job: self._on_rmtree_finished(j, p))
+        job.signals.failed.connect(lambda p, err, j=job: self._on_rmtree_failed(j, err))
+        self._delete_jobs.append(job)
+        
+        self.action_delete.setEnabled(False)
+        self.tree.setCursor(Qt.CursorShape.BusyCursor)
+        QThreadPool.globalInstance().start(job)
+    
+    def _end_rmtree(self, job: _RmTreeJob):
+        """Drop a finished delete job and restore the UI when none remain."""
+        if job in self._delete_jobs:
+            self._delete_jobs.remove(job)
+        if not self._delete_jobs:
+            self.action_delete.setEnabled(True)
+            self.tree.unsetCursor()
+    
+    def _on_rmtree_finished(self, job: _RmTreeJob, path: str):
+        self._end_rmtree(job)
+        self.file_deleted.emit(path)
+    
+    def _on_rmtree_failed(self, job: _RmTreeJob, error: str):
+        self._end_rmtree(job)
+        QMessageBox.critical(self, "Error", f"Could not delete:\n{error}")
     
     def _refresh(self):
-        """Refresh the file browser."""
-        if self._root_path:
-            self.set_root_path(self._root_path)
+        """Refresh the file browser.
+
+        Re-points the model at the current root without going through
+        set_root_path, so settings are not rewritten and
+        root_path_changed is not re-emitted.
+        """
+        if not self._root_path:
+            return
+        root = str(self._root_path)
+        self.model.setRootPath("")
+        index = self.model.setRootPath(root)
+        self.tree.setRootIndex(index)
+        self.model.dataChanged.emit(index, index)
     
     def _reveal_in_system(self):
         """Open the selected item in the system file manager."""
-        path = self.get_selected_path()
-        if not path:
+        index = self.get_selected_index()
+        if index is None:
             return
         
-        path = Path(path)
-        folder = path if path.is_dir() else path.parent
+        path = Path(self.model.filePath(index))
+        folder = path if self.model.isDir(index) else path.parent
         
         import subprocess
         try:
@@ -408,10 +563,10 @@ class FileBrowser(QWidget):
     
     def _get_selected_folder(self) -> Path | None:
         """Get the folder path for new item creation."""
-        path = self.get_selected_path()
-        if path:
-            path = Path(path)
-            if path.is_file():
+        index = self.get_selected_index()
+        if index is not None:
+            path = Path(self.model.filePath(index))
+            if not self.model.isDir(index):
                 return path.parent
             return path
         return self._root_path
@@ -490,9 +645,23 @@ class FileBrowser(QWidget):
         Returns:
             Path string or None if nothing selected
         """
+        index = self.get_selected_index()
+        if index is not None:
+            return self.model.filePath(index)
+        return None
+    
+    def get_selected_index(self) -> QModelIndex | None:
+        """Get the model index of the currently selected file/folder.
+        
+        Lets callers use the model's cached file info (isDir, filePath)
+        instead of stat-ing the path again.
+        
+        Returns:
+            QModelIndex or None if nothing selected
+        """
         indexes = self.tree.selectedIndexes()
         if indexes:
-            return self.model.filePath(indexes[0])
+            return indexes[0]
         return None
     
     def _on_double_click(self, index):
@@ -511,9 +680,9 @@ class FileBrowser(QWidget):
     
     def _open_selected_folder(self):
         """Set selected folder as the root."""
-        path = self.get_selected_path()
-        if path and Path(path).is_dir():
-            self.set_root_path(path)
+        index = self.get_selected_index()
+        if index is not None and self.model.isDir(index):
+            self.set_root_path(self.model.filePath(index))
     
     def _go_up(self):
         """Navigate to parent folder."""
@@ -4,8 +4,13 @@ Enhanced with syntax highlighting, persistent history, and formatted output.
 """
 
 import json
+import os
+import re
+import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import (
@@ -17,6 +22,60 @@ from PyQt6.QtWidgets import (
 )
 
 
+_FONTS: dict[tuple[int, bool], QFont] = {}
+
+
+def _font(size: int, bold: bool = False) -> QFont:
+    """Get a shared Source Code Pro font (resolved once per size)."""
+    key = (size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = QFont("Source Code Pro", size)
+        if bold:
+            font.setWeight(QFont.Weight.Bold)
+        _FONTS[key] = font
+    return font
+
+
+# Whitespace-delimited Forth words
+_TOKEN_RE = re.compile(r'\S+')
+
+# Line comments (\ to end of line) and parenthetical comments ( ... )
+_COMMENT_RE = re.compile(r'\\[^\n]*|\( [^)]*\)')
+
+
+# Characters a numeric literal can start with ($FF, 0x1A, -17, .5, +3)
+_NUMBER_START_CHARS = frozenset('+-0123456789.$')
+
+
+@lru_cache(maxsize=4096)
+def _is_number(word: str) -> bool:
+    """Check if word is a number.
+    
+    Cached because REPL output repeats the same literals constantly.
+    """
+    # Most tokens are words; reject them before any conversion attempt
+    if not word or word[0] not in _NUMBER_START_CHARS:
+        return False
+    if word.startswith('$'):
+        try:
+            int(word[1:], 16)
+            return True
+        except ValueError:
+            pass
+    if word.lower().startswith('0x'):
+        try:
+            int(word, 16)
+            return True
+        except ValueError:
+            pass
+    try:
+        float(word)
+        return True
+    except ValueError:
+        return False
+
+
 class ForthSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for Forth code in the REPL input."""
     
@@ -49,6 +108,9 @@ class ForthSyntaxHighlighter(QSyntaxHighlighter):
         'WORDS', 'SEE',
     }
     
+    # Re-highlighting very large documents freezes the UI
+    DEFAULT_MAX_DOC_CHARS = 500_000
+    
     def __init__(self, parent: QTextDocument):
         super().__init__(parent)
         
@@ -63,6 +125,34 @@ class ForthSyntaxHighlighter(QSyntaxHighlighter):
             'string': self._make_format('#CE9178'),       # Orange
             'comment': self._make_format('#6A9955', True), # Green italic
         }
+        
+        # One lookup per word: uppercase word -> format. Categories are
+        # added in priority order so an earlier category wins on overlap.
+        self._word_category: dict[str, QTextCharFormat] = {}
+        for words, category in (
+            (self.KEYWORDS, 'keyword'),
+            (self.STACK_WORDS, 'stack'),
+            (self.MATH_WORDS, 'math'),
+            (self.LOGIC_WORDS, 'logic'),
+            (self.OUTPUT_WORDS, 'output'),
+        ):
+            for w in words:
+                self._word_category.setdefault(sys.intern(w), self.formats[category])
+        
+        self._kw_min_len = min(len(w) for w in self._word_category)
+        self._kw_max_len = max(len(w) for w in self._word_category)
+        
+        # Skip highlighting entirely once the document grows past this
+        self._max_doc_chars = self.DEFAULT_MAX_DOC_CHARS
+    
+    def set_max_document_chars(self, limit: int):
+        """Set the document size above which highlighting is skipped.
+        
+        Args:
+            limit: Maximum document length in characters
+        """
+        self._max_doc_chars = limit
+        self.rehighlight()
     
     def _make_format(self, color: str, italic: bool = False) -> QTextCharFormat:
         """Create a text format with given color."""
@@ -74,64 +164,30 @@ class ForthSyntaxHighlighter(QSyntaxHighlighter):
     
     def highlightBlock(self, text: str):
         """Apply syntax highlighting to a block of text."""
-        # Split into words and process each
-        pos = 0
-        for word in text.split():
-            # Find position of this word
-            idx = text.find(word, pos)
-            if idx == -1:
-                continue
-            
+        if not text or text.isspace():
+            return
+        if self.document().characterCount() > self._max_doc_chars:
+            return
+        
+        # Single pass over the block, yielding each word with its offset
+        for m in _TOKEN_RE.finditer(text):
+            idx = m.start()
+            word = m.group()
             length = len(word)
-            upper_word = word.upper()
             
-            # Check category
-            if upper_word in self.KEYWORDS:
-                self.setFormat(idx, length, self.formats['keyword'])
-            elif upper_word in self.STACK_WORDS:
-                self.setFormat(idx, length, self.formats['stack'])
-            elif upper_word in self.MATH_WORDS:
-                self.setFormat(idx, length, self.formats['math'])
-            elif upper_word in self.LOGIC_WORDS:
-                self.setFormat(idx, length, self.formats['logic'])
-            elif upper_word in self.OUTPUT_WORDS:
-                self.setFormat(idx, length, self.formats['output'])
-            elif self._is_number(word):
+            # Check category (only words of a possible keyword length)
+            fmt = None
+            if self._kw_min_len <= length <= self._kw_max_len:
+                fmt = self._word_category.get(word.upper())
+            if fmt is not None:
+                self.setFormat(idx, length, fmt)
+            elif _is_number(word):
                 self.setFormat(idx, length, self.formats['number'])
-            
-            pos = idx + length
-        
-        # Handle comments - backslash to end of line
-        if '\\' in text:
-            comment_start = text.find('\\')
-            self.setFormat(comment_start, len(text) - comment_start, self.formats['comment'])
         
-        # Handle parenthetical comments
-        if '( ' in text and ')' in text:
-            start = text.find('( ')
-            end = text.find(')', start)
-            if end > start:
-                self.setFormat(start, end - start + 1, self.formats['comment'])
-    
-    def _is_number(self, word: str) -> bool:
-        """Check if word is a number."""
-        if word.startswith('$'):
-            try:
-                int(word[1:], 16)
-                return True
-            except ValueError:
-                pass
-        if word.lower().startswith('0x'):
-            try:
-                int(word, 16)
-                return True
-            except ValueError:
-                pass
-        try:
-            float(word)
-            return True
-        except ValueError:
-            return False
+        # Handle comments - \ to end of line and ( ... ) in one scan
+        comment_fmt = self.formats['comment']
+        for m in _COMMENT_RE.finditer(text):
+            self.setFormat(m.start(), m.end() - m.start(), comment_fmt)
 
 
 class HighlightedLineEdit(QLineEdit):
@@ -157,12 +213,38 @@ class ForthREPL(QWidget):
     
     input_submitted = pyqtSignal(str)
     
+    # Number of history entries kept (oldest are dropped first)
+    HISTORY_SIZE = 100
+    
+    # Number of output lines kept in the REPL before the oldest are dropped
+    SCROLLBACK_LINES = 2000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._history: List[str] = []
+        self._history: deque[str] = deque(maxlen=self.HISTORY_SIZE)
         self._history_index = 0
         self._history_file = Path.home() / '.config' / 'fable' / 'history.json'
         self._pending_ok = False
+        
+        # Coalesce bursts of submissions into one history write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_history)
+        
+        # Output fragments waiting to be inserted in one batch
+        self._pending: list[tuple[str, Optional[QTextCharFormat]]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush_output)
+        
+        # Shared char formats for colored output, keyed by (color, bold)
+        self._fmt_cache: dict[tuple[str, bool], QTextCharFormat] = {}
+        
+        # Depth and top items of the last stack preview shown
+        self._last_stack_sig: Optional[tuple] = None
+        
         self._setup_ui()
         self._load_history()
     
@@ -175,7 +257,7 @@ class ForthREPL(QWidget):
         # Output area
         self.output = QTextEdit()
         self.output.setReadOnly(True)
-        self.output.setFont(QFont("Source Code Pro", 12))
+        self.output.setFont(_font(12))
         self.output.setStyleSheet("""
             QTextEdit {
                 background-color: #1E1E1E;
@@ -185,11 +267,17 @@ class ForthREPL(QWidget):
                 padding: 8px;
             }
         """)
+        # Bound memory and per-append cost; oldest lines drop off the top
+        self.output.document().setMaximumBlockCount(self.SCROLLBACK_LINES)
         layout.addWidget(self.output)
         
+        # One long-lived cursor for appending; the widget's own cursor is
+        # only moved to keep the view scrolled to the end
+        self._end_cursor = QTextCursor(self.output.document())
+        
         # Input line
         self.input = QLineEdit()
-        self.input.setFont(QFont("Source Code Pro", 12))
+        self.input.setFont(_font(12))
         self.input.setStyleSheet("""
             QLineEdit {
                 background-color: #2D2D2D;
@@ -204,16 +292,18 @@ class ForthREPL(QWidget):
         # Prompt label (overlay on input)
         from PyQt6.QtWidgets import QLabel
         self.prompt_label = QLabel("ok> ", self.input)
-        self.prompt_label.setFont(QFont("Source Code Pro", 12))
+        self.prompt_label.setFont(_font(12))
         self.prompt_label.setStyleSheet("color: #6A9955; background: transparent;")
         self.prompt_label.move(8, 8)
         
         # Welcome message
         self._append_colored("FABLE", "#D4A017", bold=True)
         self.append_output(" - Forth Animated Beginners Learning Environment\n")
-        self._append_colored("────────────────────────────────────────────────────\n", "#3C3C3C")
-        self.append_output("Type Forth commands. Use ↑/↓ for history.\n")
-        self.append_output("Type WORDS to see available commands.\n\n")
+        self._append_colored("\u2500" * 52 + "\n", "#3C3C3C")
+        self.append_output(
+            "Type Forth commands. Use ↑/↓ for history.\n"
+            "Type WORDS to see available commands.\n\n"
+        )
     
     def _on_input_submitted(self):
         """Handle input submission."""
@@ -230,7 +320,7 @@ class ForthREPL(QWidget):
         # Add to history
         if not self._history or self._history[-1] != text:
             self._history.append(text)
-            self._save_history()
+            self._save_timer.start()
         self._history_index = len(self._history)
         
         # Echo input with prompt
@@ -247,12 +337,14 @@ class ForthREPL(QWidget):
         QTimer.singleShot(50, self._maybe_show_ok)
         
         self.input.clear()
+        self.flush_output()
     
     def _maybe_show_ok(self):
         """Show 'ok' if the command succeeded (no error was appended)."""
         if self._pending_ok:
             self._append_colored(" ok\n", "#6A9955")
             self._pending_ok = False
+            self.flush_output()
     
     def keyPressEvent(self, event):
         """Handle key presses for history navigation."""
@@ -284,25 +376,35 @@ class ForthREPL(QWidget):
             if self._history_file.exists():
                 with open(self._history_file, 'r') as f:
                     data = json.load(f)
-                    self._history = data.get('history', [])[-100:]  # Keep last 100
+                    self._history = deque(data.get('history', []), maxlen=self.HISTORY_SIZE)
                     self._history_index = len(self._history)
         except Exception:
             pass
     
-    def _save_history(self):
-        """Save command history to file."""
+    def save_history(self):
+        """Write any pending history changes to disk immediately."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_history()
+    
+    def _flush_history(self):
+        """Save command history to file.
+        
+        Writes a temporary file and swaps it in, so a crash mid-write
+        never leaves a truncated history behind.
+        """
         try:
             self._history_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._history_file, 'w') as f:
-                json.dump({'history': self._history[-100:]}, f)
+            tmp = self._history_file.with_suffix('.json.tmp')
+            with open(tmp, 'w') as f:
+                json.dump({'history': list(self._history)}, f, separators=(',', ':'))
+            os.replace(tmp, self._history_file)
         except Exception:
             pass
     
     def append_output(self, text: str):
         """Append text to output area."""
-        self.output.moveCursor(QTextCursor.MoveOperation.End)
-        self.output.insertPlainText(text)
-        self.output.moveCursor(QTextCursor.MoveOperation.End)
+        self._queue_output(text, None)
     
     def append_error(self, text: str):
         """Append error text (red) and cancel pending ok."""
@@ -311,19 +413,60 @@ class ForthREPL(QWidget):
     
     def _append_colored(self, text: str, color: str, bold: bool = False):
         """Append colored text to output."""
-        cursor = self.output.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+        key = (color, bold)
+        fmt = self._fmt_cache.get(key)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            if bold:
+                fmt.setFontWeight(700)
+            self._fmt_cache[key] = fmt
+        self._queue_output(text, fmt)
+    
+    def _queue_output(self, text: str, fmt: Optional[QTextCharFormat]):
+        """Queue a fragment for the next flush_output().
         
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        if bold:
-            fmt.setFontWeight(700)
-        cursor.insertText(text, fmt)
+        Args:
+            text: Text to append
+            fmt: Character format, or None to continue the previous one
+        """
+        self._pending.append((text, fmt))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()  # Flush from the event loop
+    
+    def flush_output(self):
+        """Insert all queued output fragments with a single repaint."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
         
+        self.output.setUpdatesEnabled(False)
+        try:
+            cursor = self._end_cursor
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            for text, fmt in pending:
+                if fmt is None:
+                    cursor.insertText(text)
+                else:
+                    cursor.insertText(text, fmt)
+        finally:
+            self.output.setUpdatesEnabled(True)
         self.output.moveCursor(QTextCursor.MoveOperation.End)
     
+    def set_scrollback(self, lines: int):
+        """Set how many output lines the REPL keeps.
+        
+        Args:
+            lines: Maximum number of lines (0 for unlimited)
+        """
+        self.output.document().setMaximumBlockCount(lines)
+    
     def clear(self):
         """Clear the output area."""
+        self._pending.clear()
+        self._flush_timer.stop()
+        self._last_stack_sig = None
         self.output.clear()
     
     def set_prompt(self, prompt: str, color: str = "#6A9955"):
@@ -344,9 +487,18 @@ class ForthREPL(QWidget):
             self.set_prompt("ok> ", "#6A9955")  # Green for interpret mode
     
     def show_stack_preview(self, stack: list):
-        """Show a brief stack preview after commands."""
+        """Show a brief stack preview after commands.
+        
+        Nothing is printed if the stack looks the same as last time.
+        """
         if not stack:
+            # Forget the last preview, so the same stack coming back shows again
+            self._last_stack_sig = None
+            return
+        sig = (len(stack), tuple(stack[-5:]))
+        if sig == self._last_stack_sig:
             return
+        self._last_stack_sig = sig
         preview = ' '.join(str(x) for x in stack[-5:])  # Last 5 items
         if len(stack) > 5:
             preview = "... " + preview
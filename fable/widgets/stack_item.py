@@ -10,6 +10,7 @@ from PyQt6.QtCore import (
 )
 from PyQt6.QtGui import QFont, QColor
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QGraphicsOpacityEffect
+from PyQt6 import sip
 
 
 # Type indicator colors
@@ -22,6 +23,72 @@ TYPE_COLORS = {
 }
 
 
+# Stylesheets are built once at import; setStyleSheet re-parses CSS, so
+# every item of a given type shares the same string
+_NORMAL_STYLES = {
+    value_type: f"""
+        QFrame {{
+            background-color: #F5F5F5;
+            border: 1px solid #CCCCCC;
+            border-left: 5px solid {type_color};
+            border-radius: 4px;
+        }}
+    """
+    for value_type, type_color in TYPE_COLORS.items()
+}
+
+_CONSUMED_STYLE = """
+    QFrame {
+        background-color: rgba(245, 245, 245, 0.5);
+        border: 2px dashed #808080;
+        border-left: 5px solid #808080;
+        border-radius: 4px;
+    }
+"""
+
+_FLASH_STYLES: dict[str, str] = {}  # highlight color -> stylesheet
+
+
+_FONTS: dict[tuple[int, bool], QFont] = {}
+
+
+def _font(size: int, bold: bool = False) -> QFont:
+    """Get the value font for a size, building it on first use.
+
+    QFont construction does a font database lookup; every stack item
+    shares the same instance (Qt copies fonts on setFont).
+    """
+    key = (size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = QFont("Source Code Pro", size)
+        if bold:
+            font.setWeight(QFont.Weight.Bold)
+        _FONTS[key] = font
+    return font
+
+
+# Free list of popped items kept for reuse by StackItemWidget.acquire()
+_WIDGET_POOL: list['StackItemWidget'] = []
+_MAX_POOL_SIZE = 64
+
+
+def _flash_style(color: str) -> str:
+    """Get the (cached) stylesheet for a highlight flash color."""
+    style = _FLASH_STYLES.get(color)
+    if style is None:
+        style = f"""
+            QFrame {{
+                background-color: {color};
+                border: 1px solid {color};
+                border-left: 5px solid {color};
+                border-radius: 4px;
+            }}
+        """
+        _FLASH_STYLES[color] = style
+    return style
+
+
 class StackItemWidget(QFrame):
     """Visual representation of a single stack value with animations.
     
@@ -42,41 +109,99 @@ class StackItemWidget(QFrame):
         super().__init__(parent)
         self._value = value
         self._value_type = value_type
+        self._opacity = 1.0
+        self._opacity_effect = None  # Created on first fade
         self._setup_ui()
-        self._setup_effects()
         self._current_animation = None
     
+    @classmethod
+    def acquire(cls, value, value_type: str = "int", parent=None) -> 'StackItemWidget':
+        """Get an item widget, reusing a pooled one when available.
+        
+        Pooled widgets come back hidden; the caller shows them (directly
+        or via animate_push) once they are in a layout.
+        
+        Args:
+            value: The value to display
+            value_type: Type identifier
+            parent: Parent widget
+        """
+        while _WIDGET_POOL:
+            item = _WIDGET_POOL.pop()
+            if sip.isdeleted(item):
+                continue  # Destroyed along with its old parent
+            if item.parent() is not parent:
+                item.setParent(parent)
+            item.reset(value, value_type)
+            return item
+        return cls(value, value_type, parent)
+    
+    def release(self):
+        """Hide this item and return it to the pool for reuse."""
+        if self._current_animation is not None:
+            self._current_animation.stop()
+            self._current_animation = None
+        self.hide()
+        if len(_WIDGET_POOL) < _MAX_POOL_SIZE:
+            _WIDGET_POOL.append(self)
+        else:
+            self.deleteLater()
+    
+    def reset(self, value, value_type: str = "int"):
+        """Rebind this widget to a new value without rebuilding it.
+        
+        Args:
+            value: The value to display
+            value_type: Type identifier
+        """
+        self._value = value
+        if value_type != self._value_type:
+            self._value_type = value_type
+            self._style_normal = _NORMAL_STYLES.get(value_type, _NORMAL_STYLES['int'])
+        self.setStyleSheet(self._style_normal)
+        self.value_label.setText(self._format_value())
+        self.opacity = 1.0
+    
     def _setup_ui(self):
         """Initialize the user interface."""
         self.setFixedHeight(40)
         self.setMinimumWidth(120)
         
-        type_color = TYPE_COLORS.get(self._value_type, TYPE_COLORS['int'])
-        
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: #F5F5F5;
-                border: 1px solid #CCCCCC;
-                border-left: 5px solid {type_color};
-                border-radius: 4px;
-            }}
-        """)
+        self._style_normal = _NORMAL_STYLES.get(self._value_type, _NORMAL_STYLES['int'])
+        self.setStyleSheet(self._style_normal)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 4, 12, 4)
         
         # Value display
         self.value_label = QLabel(self._format_value())
-        self.value_label.setFont(QFont("Source Code Pro", 14, QFont.Weight.Bold))
+        self.value_label.setFont(_font(14, bold=True))
         self.value_label.setStyleSheet("color: #1E1E1E; border: none; background: transparent;")
         layout.addWidget(self.value_label)
         layout.addStretch()
     
-    def _setup_effects(self):
-        """Set up graphics effects for animations."""
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.opacity_effect.setOpacity(1.0)
-        self.setGraphicsEffect(self.opacity_effect)
+    def _get_opacity(self) -> float:
+        return self._opacity
+    
+    def _set_opacity(self, value: float):
+        """Set item opacity.
+        
+        The opacity effect is only enabled while the item is partly
+        transparent; a fully opaque item paints through Qt's normal path
+        instead of an offscreen effect buffer.
+        """
+        self._opacity = value
+        if value >= 1.0:
+            if self._opacity_effect is not None:
+                self._opacity_effect.setEnabled(False)
+            return
+        if self._opacity_effect is None:
+            self._opacity_effect = QGraphicsOpacityEffect(self)
+            self.setGraphicsEffect(self._opacity_effect)
+        self._opacity_effect.setOpacity(value)
+        self._opacity_effect.setEnabled(True)
+    
+    opacity = pyqtProperty(float, _get_opacity, _set_opacity)
     
     def _format_value(self) -> str:
         """Format the value for display."""
@@ -112,11 +237,11 @@ class StackItemWidget(QFrame):
         the layout and causes overlapping items.
         """
         # Start invisible
-        self.opacity_effect.setOpacity(0)
+        self.opacity = 0.0
         self.show()
 
         # Fade in animation only
-        opacity_anim = QPropertyAnimation(self.opacity_effect, b"opacity")
+        opacity_anim = QPropertyAnimation(self, b"opacity")
         opacity_anim.setDuration(duration_ms)
         opacity_anim.setStartValue(0.0)
         opacity_anim.setEndValue(1.0)
@@ -136,32 +261,34 @@ class StackItemWidget(QFrame):
         # First highlight amber
         self._flash_highlight('#D4A017', duration_ms // 2)
         
-        # Then fade out after highlight
-        QTimer.singleShot(duration_ms // 2, lambda: self._do_pop_animation(duration_ms, on_complete))
+        # Then fade out after highlight, as one scheduled sequence
+        group = QSequentialAnimationGroup(self)
+        group.addPause(duration_ms // 2)
+        group.addAnimation(self._pop_fade_animation(duration_ms))
+        
+        def on_finished():
+            self.animation_finished.emit()
+            self.release()
+            if on_complete:
+                on_complete()
+        
+        group.finished.connect(on_finished)
+        self._current_animation = group
+        group.start(QSequentialAnimationGroup.DeletionPolicy.DeleteWhenStopped)
     
-    def _do_pop_animation(self, duration_ms: int, on_complete=None):
-        """Execute the pop fade-out animation.
+    def _pop_fade_animation(self, duration_ms: int) -> QPropertyAnimation:
+        """Build the pop fade-out animation.
 
         Note: We only animate opacity, not position, to avoid
         interfering with the layout manager.
         """
         # Fade out animation only
-        opacity_anim = QPropertyAnimation(self.opacity_effect, b"opacity")
+        opacity_anim = QPropertyAnimation(self, b"opacity")
         opacity_anim.setDuration(duration_ms)
         opacity_anim.setStartValue(1.0)
         opacity_anim.setEndValue(0.0)
         opacity_anim.setEasingCurve(QEasingCurve.Type.InCubic)
-
-        def on_finished():
-            self.animation_finished.emit()
-            self.hide()
-            self.deleteLater()
-            if on_complete:
-                on_complete()
-
-        opacity_anim.finished.connect(on_finished)
-        self._current_animation = opacity_anim
-        opacity_anim.start()
+        return opacity_anim
     
     def animate_move_to(self, target_pos: QPoint, duration_ms: int = 300):
         """Animate movement to a new position.
@@ -186,26 +313,8 @@ class StackItemWidget(QFrame):
             color: Highlight color (hex)
             duration_ms: Duration of highlight
         """
-        type_color = TYPE_COLORS.get(self._value_type, TYPE_COLORS['int'])
-        original_style = f"""
-            QFrame {{
-                background-color: #F5F5F5;
-                border: 1px solid #CCCCCC;
-                border-left: 5px solid {type_color};
-                border-radius: 4px;
-            }}
-        """
-        highlight_style = f"""
-            QFrame {{
-                background-color: {color};
-                border: 1px solid {color};
-                border-left: 5px solid {color};
-                border-radius: 4px;
-            }}
-        """
-        self.setStyleSheet(highlight_style)
-        self.value_label.setStyleSheet("color: #1E1E1E; border: none; background: transparent;")
-        QTimer.singleShot(duration_ms, lambda: self.setStyleSheet(original_style))
+        self.setStyleSheet(_flash_style(color))
+        QTimer.singleShot(duration_ms, lambda: self.setStyleSheet(self._style_normal))
     
     def highlight_consumed(self, enabled: bool = True):
         """Show/hide consumption preview indicator.
@@ -214,24 +323,9 @@ class StackItemWidget(QFrame):
             enabled: Whether to show the indicator
         """
         if enabled:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: rgba(245, 245, 245, 0.5);
-                    border: 2px dashed #808080;
-                    border-left: 5px solid #808080;
-                    border-radius: 4px;
-                }
-            """)
+            self.setStyleSheet(_CONSUMED_STYLE)
         else:
-            type_color = TYPE_COLORS.get(self._value_type, TYPE_COLORS['int'])
-            self.setStyleSheet(f"""
-                QFrame {{
-                    background-color: #F5F5F5;
-                    border: 1px solid #CCCCCC;
-                    border-left: 5px solid {type_color};
-                    border-radius: 4px;
-                }}
-            """)
+            self.setStyleSheet(self._style_normal)
     
     def pulse(self, duration_ms: int = 200):
         """Pulse animation for DUP-like operations.
@@ -3,15 +3,91 @@ Animated stack widget for visualizing data and return stacks.
 Displays stack operations with smooth animations synchronized to the interpreter.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional, Any
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QSlider, QPushButton, QScrollArea, QFrame, QSizePolicy
 )
 
-from .stack_item import StackItemWidget, TYPE_COLORS
+from .stack_item import StackItemWidget
+
+
+# Default panel styling, built once and applied from the root widget;
+# child controls are matched by object name so they don't each get their
+# own stylesheet
+_WIDGET_QSS = """
+    QWidget {
+        background-color: #252526;
+    }
+"""
+
+_CONTROLS_BG_QSS = """
+    #stackControls, #stackControls * {
+        background-color: #2D2D2D;
+    }
+    QLabel#stackSpeedLabel {
+        color: #808080;
+    }
+"""
+
+_SLIDER_QSS = """
+    QSlider#stackSpeedSlider::groove:horizontal {
+        background: #3C3C3C;
+        height: 6px;
+        border-radius: 3px;
+    }
+    QSlider#stackSpeedSlider::handle:horizontal {
+        background: #007ACC;
+        width: 16px;
+        margin: -5px 0;
+        border-radius: 8px;
+    }
+    QSlider#stackSpeedSlider::sub-page:horizontal {
+        background: #007ACC;
+        border-radius: 3px;
+    }
+"""
+
+_STEP_BUTTON_QSS = """
+    QPushButton#stackStepButton {
+        background-color: #0E639C;
+        color: white;
+        border: none;
+        padding: 6px 16px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    QPushButton#stackStepButton:hover {
+        background-color: #1177BB;
+    }
+    QPushButton#stackStepButton:pressed {
+        background-color: #0D5A8C;
+    }
+"""
+
+_GLOBAL_QSS = _WIDGET_QSS + _CONTROLS_BG_QSS + _SLIDER_QSS + _STEP_BUTTON_QSS
+
+# Section header font, shared by every StackSection (setFont copies it)
+_HEADER_FONT = QFont("Segoe UI", 11, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=256)
+def _upper(word: str) -> str:
+    """Uppercase a word name (the same few words repeat during execution)."""
+    return word.upper()
+
+
+# Exact type -> identifier; keyed on type() so bools never match int
+_TYPE_DISPATCH = {
+    bool: lambda v: 'bool',
+    int: lambda v: 'bool' if v in (-1, 0) else 'int',  # Common flag values
+    float: lambda v: 'float',
+    str: lambda v: 'string',
+}
 
 
 def _infer_type(value) -> str:
@@ -23,17 +99,19 @@ def _infer_type(value) -> str:
     Returns:
         Type identifier string
     """
-    if isinstance(value, bool):
-        return 'bool'
-    if isinstance(value, int):
-        if value in (-1, 0):  # Common flag values
-            return 'bool'
-        return 'int'
-    if isinstance(value, float):
-        return 'float'
-    if isinstance(value, str):
-        return 'string'
-    return 'int'
+    fn = _TYPE_DISPATCH.get(type(value))
+    return fn(value) if fn is not None else 'int'
+
+
+def _same_stack(a: List[Any], b: List[Any]) -> bool:
+    """Check whether two stack snapshots would display the same.
+    
+    Plain == treats 1 and 1.0 (or 0 and False) as equal, so the
+    element types are compared as well.
+    """
+    if a is b:
+        return True
+    return a == b and all(type(x) is type(y) for x, y in zip(a, b))
 
 
 class StackSection(QWidget):
@@ -43,11 +121,22 @@ class StackSection(QWidget):
     Supports animated push/pop/swap operations.
     """
     
+    # Hidden items created with the section and parked in the item pool
+    PREALLOCATED_ITEMS = 8
+    
     def __init__(self, title: str, parent=None):
         super().__init__(parent)
         self._title = title
         self._items: List[StackItemWidget] = []
+        self._last_values: List[Any] = []  # Values shown by the items
         self._animation_duration = 150  # Base duration in ms
+        self._follow_push = False  # Scroll to bottom when the range grows
+        # Ends _follow_push once the push's layout pass has run, in case
+        # the range never changed (the new items still fit)
+        self._follow_timer = QTimer(self)
+        self._follow_timer.setSingleShot(True)
+        self._follow_timer.setInterval(0)
+        self._follow_timer.timeout.connect(self._end_follow_push)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -58,7 +147,7 @@ class StackSection(QWidget):
         
         # Header - no hardcoded style, will be themed
         self.header = QLabel(self._title)
-        self.header.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        self.header.setFont(_HEADER_FONT)
         self.header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.header)
         
@@ -66,6 +155,7 @@ class StackSection(QWidget):
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scroll.verticalScrollBar().rangeChanged.connect(self._on_scroll_range_changed)
         
         # Container for stack items
         self.container = QWidget()
@@ -81,6 +171,10 @@ class StackSection(QWidget):
         self.empty_label = QLabel("(empty)")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.container_layout.insertWidget(0, self.empty_label)
+        
+        # Build a few items up front so the first pushes come from the pool
+        for _ in range(self.PREALLOCATED_ITEMS):
+            StackItemWidget(0, 'int', self.container).release()
     
     def set_animation_speed(self, duration_ms: int):
         """Set base animation duration.
@@ -99,35 +193,66 @@ class StackSection(QWidget):
             values: Current stack values (bottom to top)
             animate: Whether to animate changes
         """
+        animate = self._should_animate(animate)
+        
         # Hide empty label if we have items
         self.empty_label.setVisible(len(values) == 0)
         
+        # Items below the first changed position are left untouched
+        last = self._last_values
+        lcp = min(len(last), len(values))
+        for i, (old, new) in enumerate(zip(last, values)):
+            if type(old) is not type(new) or old != new:
+                lcp = i
+                break
+        
         current_count = len(self._items)
         new_count = len(values)
         
+        # Rebind changed values that still have an item (swap, etc.);
+        # the type may differ, so restyle along with the text
+        for i in range(lcp, min(current_count, new_count)):
+            self._items[i].reset(values[i], _infer_type(values[i]))
+        
         if new_count > current_count:
-            # Items were pushed
-            for i in range(current_count, new_count):
-                self._add_item(values[i], animate)
+            # Items were pushed; lay out and paint the batch only once
+            self.container.setUpdatesEnabled(False)
+            try:
+                for i in range(current_count, new_count):
+                    self._add_item(values[i], animate, defer_scroll=True)
+            finally:
+                self.container.setUpdatesEnabled(True)
+            self._scroll_to_bottom()
         elif new_count < current_count:
             # Items were popped
             for _ in range(current_count - new_count):
                 self._remove_item(animate)
-        else:
-            # Same count - update values (might be swap, etc.)
-            for i, value in enumerate(values):
-                if i < len(self._items):
-                    self._items[i].value = value
+        
+        self._last_values = list(values)
     
-    def _add_item(self, value, animate: bool = True):
+    def _should_animate(self, animate: bool) -> bool:
+        """Check whether an update's animations would actually be seen.
+        
+        Hidden sections, zero-length animations and background windows
+        get instant updates instead.
+        
+        Args:
+            animate: Whether the caller asked for animation
+        """
+        if not animate or self._animation_duration <= 0 or not self.isVisible():
+            return False
+        return self.window().isActiveWindow()
+    
+    def _add_item(self, value, animate: bool = True, defer_scroll: bool = False):
         """Add a new item (push operation).
         
         Args:
             value: Value to push
             animate: Whether to animate
+            defer_scroll: Leave scrolling to the caller (batched pushes)
         """
         value_type = _infer_type(value)
-        item = StackItemWidget(value, value_type, self.container)
+        item = StackItemWidget.acquire(value, value_type, self.container)
         
         # Insert before the stretch at the end
         self.container_layout.insertWidget(
@@ -138,13 +263,34 @@ class StackSection(QWidget):
         
         if animate:
             item.animate_push(self._animation_duration)
+        else:
+            item.show()  # Pooled items come back hidden
             
         # Ensure new item is visible
-        QTimer.singleShot(10, lambda: self._ensure_visible(item))
+        if not defer_scroll:
+            self._scroll_to_bottom()
     
-    def _ensure_visible(self, item):
-        """Scroll to make item visible."""
-        self.scroll.ensureWidgetVisible(item)
+    def _scroll_to_bottom(self):
+        """Scroll to the top of stack (newest items are at the bottom).
+        
+        The scroll range only grows once the layout has placed the new
+        items, so the seek is repeated from rangeChanged.
+        """
+        self._follow_push = True
+        self._follow_timer.start()
+        bar = self.scroll.verticalScrollBar()
+        bar.setValue(bar.maximum())
+    
+    def _end_follow_push(self):
+        """Stop following pushes, so later range changes keep the view."""
+        self._follow_push = False
+        self._follow_timer.stop()
+    
+    def _on_scroll_range_changed(self, minimum: int, maximum: int):
+        """Finish a pending scroll-to-bottom once the layout has settled."""
+        if self._follow_push:
+            self._end_follow_push()
+            self.scroll.verticalScrollBar().setValue(maximum)
     
     def _remove_item(self, animate: bool = True):
         """Remove top item (pop operation).
@@ -152,6 +298,7 @@ class StackSection(QWidget):
         Args:
             animate: Whether to animate
         """
+        self._end_follow_push()
         if not self._items:
             return
 
@@ -161,10 +308,10 @@ class StackSection(QWidget):
         self.container_layout.removeWidget(item)
 
         if animate:
-            # Animate fade-out, then delete
+            # Animate fade-out, then return to the pool
             item.animate_pop(self._animation_duration)
         else:
-            item.deleteLater()
+            item.release()
     
     def clear_all(self, animate: bool = False):
         """Clear all items.
@@ -172,10 +319,12 @@ class StackSection(QWidget):
         Args:
             animate: Whether to animate removal
         """
+        self._end_follow_push()
         for item in self._items:
             self.container_layout.removeWidget(item)
-            item.deleteLater()
+            item.release()
         self._items.clear()
+        self._last_values = []
         self.empty_label.setVisible(True)
     
     def highlight_top(self, count: int = 1):
@@ -212,20 +361,33 @@ class StackWidget(QWidget):
     step_clicked = pyqtSignal()
     speed_changed = pyqtSignal(int)
     
+    # How many items each word consumes, for the operation preview
+    _CONSUME_COUNTS = MappingProxyType({
+        '+': 2, '-': 2, '*': 2, '/': 2, 'MOD': 2,
+        'DUP': 1, 'DROP': 1, 'SWAP': 2, 'OVER': 2, 'ROT': 3,
+        '.': 1, 'NEGATE': 1, 'ABS': 1, '1+': 1, '1-': 1,
+        '=': 2, '<': 2, '>': 2, 'AND': 2, 'OR': 2, 'XOR': 2,
+    })
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
         self._current_stack: List[Any] = []
         self._current_rstack: List[Any] = []
+        
+        # Latest stack states waiting for the next frame (None = no change)
+        self._pending_data: Optional[List[Any]] = None
+        self._pending_rstack: Optional[List[Any]] = None
+        self._pending_animate = True
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)  # ~one frame at 60 Hz
+        self._flush_timer.timeout.connect(self._flush_pending)
     
     def _setup_ui(self):
         """Initialize the UI."""
         self.setMinimumWidth(250)
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #252526;
-            }
-        """)
+        self.setStyleSheet(_GLOBAL_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -241,13 +403,13 @@ class StackWidget(QWidget):
         
         # Control bar
         self.controls_widget = QWidget()
-        self.controls_widget.setStyleSheet("background-color: #2D2D2D;")
+        self.controls_widget.setObjectName("stackControls")
         controls_layout = QHBoxLayout(self.controls_widget)
         controls_layout.setContentsMargins(8, 8, 8, 8)
         
         # Speed label
         self.speed_label = QLabel("Speed:")
-        self.speed_label.setStyleSheet("color: #808080;")
+        self.speed_label.setObjectName("stackSpeedLabel")
         controls_layout.addWidget(self.speed_label)
         
         # Speed slider
@@ -255,44 +417,15 @@ class StackWidget(QWidget):
         self.speed_slider.setRange(0, 100)
         self.speed_slider.setValue(90)  # Default to fast (~300ms)
         self.speed_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.speed_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #3C3C3C;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #007ACC;
-                width: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #007ACC;
-                border-radius: 3px;
-            }
-        """)
-        self.speed_slider.valueChanged.connect(self._on_speed_changed)
+        self.speed_slider.setObjectName("stackSpeedSlider")
+        self.speed_slider.setToolTip(f"{self.get_current_delay()} ms")
+        self.speed_slider.valueChanged.connect(self._on_speed_preview)
+        self.speed_slider.sliderReleased.connect(self._on_speed_committed)
         controls_layout.addWidget(self.speed_slider)
         
         # Step button
         self.step_button = QPushButton("Step")
-        self.step_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0E639C;
-                color: white;
-                border: none;
-                padding: 6px 16px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1177BB;
-            }
-            QPushButton:pressed {
-                background-color: #0D5A8C;
-            }
-        """)
+        self.step_button.setObjectName("stackStepButton")
         self.step_button.clicked.connect(self.step_clicked.emit)
         controls_layout.addWidget(self.step_button)
         
@@ -306,8 +439,19 @@ class StackWidget(QWidget):
         min_delay = 10
         return int(max_delay - (value / 100.0) * (max_delay - min_delay))
 
-    def _on_speed_changed(self, value: int):
-        """Handle speed slider change."""
+    def _on_speed_preview(self, value: int):
+        """Handle speed slider change.
+        
+        While the handle is being dragged only the tooltip follows it;
+        the new speed is applied once on release. Keyboard, wheel and
+        page-step changes have no release, so they apply immediately.
+        """
+        self.speed_slider.setToolTip(f"{self.get_current_delay()} ms")
+        if not self.speed_slider.isSliderDown():
+            self._on_speed_committed()
+    
+    def _on_speed_committed(self):
+        """Apply the slider's speed to the stacks and the interpreter."""
         delay = self.get_current_delay()
         self.data_section.set_animation_speed(delay)
         self.return_section.set_animation_speed(delay)
@@ -316,25 +460,62 @@ class StackWidget(QWidget):
     def update_data_stack(self, values: List[Any], animate: bool = True):
         """Update the data stack display.
         
+        The list is kept rather than copied, so callers must pass a
+        snapshot they won't mutate (the interpreter's signals do).
+        
         Args:
             values: Current stack values (bottom to top)
             animate: Whether to animate changes
         """
-        self._current_stack = list(values)
-        self.data_section.update_stack(values, animate)
+        if _same_stack(values, self._current_stack):
+            return
+        self._current_stack = values
+        self._pending_data = values
+        self._schedule_flush(animate)
     
     def update_return_stack(self, values: List[Any], animate: bool = True):
         """Update the return stack display.
         
+        Like update_data_stack(), keeps the list without copying it.
+        
         Args:
             values: Current stack values
             animate: Whether to animate
         """
-        self._current_rstack = list(values)
-        self.return_section.update_stack(values, animate)
+        if _same_stack(values, self._current_rstack):
+            return
+        self._current_rstack = values
+        self._pending_rstack = values
+        self._schedule_flush(animate)
+    
+    def _schedule_flush(self, animate: bool):
+        """Queue a display update for the next frame.
+        
+        Bursts of updates (one per executed word) collapse into a single
+        update_stack() pass with the latest state.
+        
+        Args:
+            animate: Whether to animate changes
+        """
+        self._pending_animate = animate
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_pending(self):
+        """Render the latest queued stack states."""
+        self._flush_timer.stop()
+        data, self._pending_data = self._pending_data, None
+        rstack, self._pending_rstack = self._pending_rstack, None
+        if data is not None:
+            self.data_section.update_stack(data, self._pending_animate)
+        if rstack is not None:
+            self.return_section.update_stack(rstack, self._pending_animate)
     
     def clear(self):
         """Clear both stacks."""
+        self._flush_timer.stop()
+        self._pending_data = None
+        self._pending_rstack = None
         self.data_section.clear_all()
         self.return_section.clear_all()
         self._current_stack = []
@@ -346,14 +527,7 @@ class StackWidget(QWidget):
         Args:
             word: Word being executed
         """
-        # Map words to how many items they consume
-        consume_counts = {
-            '+': 2, '-': 2, '*': 2, '/': 2, 'MOD': 2,
-            'DUP': 1, 'DROP': 1, 'SWAP': 2, 'OVER': 2, 'ROT': 3,
-            '.': 1, 'NEGATE': 1, 'ABS': 1, '1+': 1, '1-': 1,
-            '=': 2, '<': 2, '>': 2, 'AND': 2, 'OR': 2, 'XOR': 2,
-        }
-        count = consume_counts.get(word.upper(), 0)
+        count = self._CONSUME_COUNTS.get(_upper(word), 0)
         if count > 0:
             self.data_section.highlight_top(count)
     
@@ -361,7 +535,9 @@ class StackWidget(QWidget):
         """Clear operation preview highlights."""
         self.data_section.clear_highlights()
     
-    # Slots for interpreter signals
+    # Slots for interpreter signals (decorated so PyQt dispatches them
+    # without per-call argument introspection)
+    @pyqtSlot(str, str)
     def on_word_starting(self, word: str, stack_effect: str):
         """Handle word_starting signal from interpreter.
         
@@ -371,6 +547,7 @@ class StackWidget(QWidget):
         """
         self.show_operation_preview(word)
     
+    @pyqtSlot(str, list)
     def on_word_complete(self, word: str, stack_state: List[Any]):
         """Handle word_complete signal from interpreter.
         
@@ -379,8 +556,10 @@ class StackWidget(QWidget):
             stack_state: Current stack after operation
         """
         self.clear_preview()
+        # update_data_stack() skips words with no net stack effect
         self.update_data_stack(stack_state)
     
+    @pyqtSlot(list, list)
     def on_state_changed(self, data_stack: List[Any], return_stack: List[Any]):
         """Handle full state update.
         
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+
+# Widget tests need no display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication widget tests run under."""
+    app = QApplication.instance() or QApplication([])
+    yield app
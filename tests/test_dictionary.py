@@ -1,3 +1,48 @@
 """
 Tests for Dictionary.
 """
+
+from fable.interpreter.dictionary import Dictionary, DictionaryEntry
+
+
+class TestVersion:
+    """Test the change counter used to cache lookups."""
+    
+    def setup_method(self):
+        self.dictionary = Dictionary()
+    
+    def test_define_bumps_version(self):
+        """Defining or redefining a word changes the version."""
+        before = self.dictionary.version
+        self.dictionary.define(DictionaryEntry(name="foo", code=[]))
+        after_define = self.dictionary.version
+        self.dictionary.define(DictionaryEntry(name="FOO", code=[]))
+        assert before < after_define < self.dictionary.version
+    
+    def test_forget_bumps_version(self):
+        """Forgetting a word changes the version; a miss doesn't."""
+        self.dictionary.define(DictionaryEntry(name="foo", code=[]))
+        before = self.dictionary.version
+        assert not self.dictionary.forget("bar")
+        assert self.dictionary.version == before
+        assert self.dictionary.forget("foo")
+        assert self.dictionary.version > before
+
+
+class TestFindSimilar:
+    """Test "did you mean?" suggestions."""
+    
+    def setup_method(self):
+        self.dictionary = Dictionary()
+        for name in ("DUP", "2DUP", "DROP"):
+            self.dictionary.define(DictionaryEntry(name=name, code=[]))
+    
+    def test_suggestions(self):
+        """Close names are suggested, best first."""
+        assert self.dictionary.find_similar("dupp") == ["DUP", "2DUP"]
+    
+    def test_new_word_updates_suggestions(self):
+        """Cached suggestions are refreshed after a define."""
+        assert self.dictionary.find_similar("DUPE") == ["DUP", "2DUP"]
+        self.dictionary.define(DictionaryEntry(name="DUPE", code=[]))
+        assert self.dictionary.find_similar("DUPE")[0] == "DUPE"
@@ -258,3 +258,88 @@ class TestOutput:
         assert "2" in output  
         assert "3" in output
         assert self.interp.data_stack == [1, 2, 3]
+    
+    def test_output_batched_per_evaluate(self):
+        """Output from one evaluate arrives as a single emit."""
+        self.interp.evaluate('1 . 2 . ." done"')
+        assert self.output == ["1 2 done"]
+    
+    def test_output_flushed_before_error(self):
+        """Buffered output is sent before the error signal."""
+        self.interp.error_occurred.connect(lambda s: self.output.append("<error>"))
+        with pytest.raises(StackUnderflowError):
+            self.interp.evaluate("7 . DROP")
+        assert self.output == ["7 ", "<error>"]
+
+
+class TestSuperinstructions:
+    """Test fused word pairs in compiled definitions."""
+    
+    def setup_method(self):
+        self.interp = ForthInterpreter()
+    
+    def test_fused_pairs(self):
+        """DUP *, SWAP DROP and n + give the same results when fused."""
+        self.interp.evaluate(": SQUARE DUP * ; : MYNIP SWAP DROP ; : INC 1 + ;")
+        self.interp.evaluate("7 SQUARE 1 2 MYNIP 41 INC")
+        assert self.interp.data_stack == [49, 2, 42]
+    
+    def test_fused_underflow(self):
+        """A fused pair still reports the word that underflowed."""
+        self.interp.evaluate(": MYNIP SWAP DROP ;")
+        with pytest.raises(StackUnderflowError) as exc_info:
+            self.interp.evaluate("1 MYNIP")
+        assert "SWAP" in str(exc_info.value)
+    
+    def test_failing_pair_leaves_unfused_stack(self):
+        """A TypeError in a fused pair leaves the stack an unfused run would."""
+        self.interp.evaluate(': G S" hi" 1 + ; : H 7 S" hi" DUP * ;')
+        with pytest.raises(TypeError):
+            self.interp.evaluate("G")
+        assert self.interp.data_stack == []
+        with pytest.raises(TypeError):
+            self.interp.evaluate("H")
+        assert self.interp.data_stack == [7]
+    
+    def test_redefined_word_not_fused(self):
+        """Redefining a fused word after compiling is honoured."""
+        self.interp.evaluate(": SQUARE DUP * ;")
+        self.interp.evaluate("3 SQUARE")
+        self.interp.evaluate(": DUP 10 ;")
+        self.interp.evaluate("3 SQUARE")
+        assert self.interp.data_stack == [9, 30]
+    
+    def test_traced_pairs_run_as_separate_words(self):
+        """Listeners still see every word of a fused pair."""
+        words = []
+        self.interp.word_starting.connect(lambda name, effect: words.append(name))
+        self.interp.evaluate(": SQUARE DUP * ; 4 SQUARE")
+        assert words == ['4', 'SQUARE', 'DUP', '*']
+        assert self.interp.data_stack == [16]
+
+
+class TestConstantFolding:
+    """Test folding of literal-only arithmetic in compiled definitions."""
+    
+    def setup_method(self):
+        self.interp = ForthInterpreter()
+    
+    def test_folded_result(self):
+        """Folded runs give the same values as running them."""
+        self.interp.evaluate(": CALC 3 4 + 5 * 7 2 / 3 4 < ;")
+        self.interp.evaluate("CALC")
+        assert self.interp.data_stack == [35, 3, -1]
+    
+    def test_raising_word_not_folded(self):
+        """Division by zero still raises when the word runs."""
+        self.interp.evaluate(": BAD 10 0 / ;")
+        with pytest.raises(DivisionByZeroError):
+            self.interp.evaluate("BAD")
+    
+    def test_traced_run_shows_every_word(self):
+        """Listeners still see each literal and word of a folded run."""
+        words = []
+        self.interp.word_starting.connect(lambda name, effect: words.append(name))
+        self.interp.evaluate(": SEVEN 3 4 + ; SEVEN")
+        assert words == ['SEVEN', '3', '4', '+']
+        assert self.interp.data_stack == [7]
@@ -4,6 +4,8 @@ Test script for the FABLE library system.
 Tests INCLUDE, SAVE-LIBRARY, and related words.
 """
 
+from pathlib import Path
+
 from fable.interpreter.interpreter import ForthInterpreter
 
 def test_library_words():
@@ -13,12 +15,14 @@ def test_library_words():
     print("=" * 60)
     
     interp = ForthInterpreter()
+    lib_dir = Path.home() / '.config' / 'fable' / 'libraries'
     
     # Test 1: Check that library words exist
     print("\n1. Checking library words are registered...")
     library_words = ['INCLUDE', 'SAVE-LIBRARY', 'LOADED-LIBRARIES', 'LIBRARY-PATH']
+    registered = set(interp.dictionary.words())
     for word in library_words:
-        if interp.dictionary.contains(word):
+        if word in registered:
             print(f"   ✓ {word} registered")
         else:
             print(f"   ✗ {word} NOT FOUND")
@@ -88,8 +92,7 @@ def test_library_words():
         print("   ✓ SAVE-LIBRARY executed")
         
         # Check if file was created
-        from pathlib import Path
-        lib_file = Path.home() / '.config' / 'fable' / 'libraries' / 'test-lib.fth'
+        lib_file = lib_dir / 'test-lib.fth'
         if lib_file.exists():
             print(f"   ✓ Library file created: {lib_file}")
             print(f"\n   Contents:")
@@ -0,0 +1,86 @@
+"""
+Tests for the REPL widget.
+"""
+
+import pytest
+from PyQt6.QtGui import QTextDocument
+from fable.widgets.repl import ForthREPL, ForthSyntaxHighlighter
+
+
+class TestStackPreview:
+    """Test the stack preview shown after commands."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_repl(self, qapp):
+        self.repl = ForthREPL()
+        self.repl.clear()
+        yield
+        self.repl.deleteLater()
+    
+    def _previews(self):
+        self.repl.flush_output()
+        return [line for line in self.repl.output.toPlainText().splitlines()
+                if line.startswith("  [")]
+    
+    def test_unchanged_stack_not_repeated(self):
+        """The same stack twice in a row gives one preview."""
+        self.repl.show_stack_preview([1, 2])
+        self.repl.show_stack_preview([1, 2])
+        assert self._previews() == ["  [1 2]"]
+    
+    def test_change_below_top_five_not_shown(self):
+        """Only depth and the top five items decide whether to reprint.
+        
+        The preview shows just those items, so a change deeper in the
+        stack would print an identical line and is skipped.
+        """
+        self.repl.show_stack_preview([0, 1, 2, 3, 4, 5])
+        self.repl.show_stack_preview([9, 1, 2, 3, 4, 5])
+        assert self._previews() == ["  [... 1 2 3 4 5]"]
+        
+        # A different depth with the same top five is a new preview
+        self.repl.show_stack_preview([8, 9, 1, 2, 3, 4, 5])
+        assert self._previews() == ["  [... 1 2 3 4 5]", "  [... 1 2 3 4 5]"]
+    
+    def test_stack_shown_again_after_empty(self):
+        """A stack that empties and comes back is previewed again."""
+        self.repl.show_stack_preview([5])
+        self.repl.show_stack_preview([])
+        self.repl.show_stack_preview([5])
+        assert self._previews() == ["  [5]", "  [5]"]
+
+
+class TestHighlighterSizeCap:
+    """Test the document size above which highlighting is skipped."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_highlighter(self, qapp):
+        self.doc = QTextDocument()
+        self.doc.documentLayout()  # Edits only signal once a layout exists
+        self.highlighter = ForthSyntaxHighlighter(self.doc)
+        qapp.processEvents()  # Let the initial delayed rehighlight run
+    
+    def _highlighted_words(self):
+        block = self.doc.firstBlock()
+        text = block.text()
+        return [text[r.start:r.start + r.length] for r in block.layout().formats()]
+    
+    def test_small_document_highlighted(self):
+        """Documents under the limit are highlighted."""
+        self.doc.setPlainText("5 DUP *")
+        assert self._highlighted_words() == ["5", "DUP", "*"]
+    
+    def test_large_document_skipped(self):
+        """highlightBlock does nothing once the document is over the limit."""
+        self.highlighter.set_max_document_chars(4)
+        self.doc.setPlainText("5 DUP *")
+        assert self._highlighted_words() == []
+    
+    def test_setter_rehighlights(self):
+        """Changing the limit re-highlights the existing text."""
+        self.highlighter.set_max_document_chars(4)
+        self.doc.setPlainText("5 DUP *")
+        self.highlighter.set_max_document_chars(1000)
+        assert self._highlighted_words() == ["5", "DUP", "*"]
+        self.highlighter.set_max_document_chars(4)
+        assert self._highlighted_words() == []
@@ -1,3 +1,72 @@
 """
 Tests for StackWidget.
 """
+
+import pytest
+from fable.widgets.stack_widget import StackSection
+
+
+class TestScrollFollow:
+    """Test scrolling to the top of stack after pushes."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_section(self, qapp):
+        self.app = qapp
+        self.section = StackSection("Data")
+        self.section.show()
+        self.bar = self.section.scroll.verticalScrollBar()
+        yield
+        self.section.deleteLater()
+    
+    def _settle(self):
+        for _ in range(5):
+            self.app.processEvents()
+    
+    def test_push_scrolls_to_bottom(self):
+        """Pushing past the visible area scrolls to the newest item."""
+        self.section.resize(200, 300)
+        self._settle()
+        self.section.update_stack(list(range(30)), animate=False)
+        self._settle()
+        assert self.bar.maximum() > 0
+        assert self.bar.value() == self.bar.maximum()
+    
+    def test_fitting_push_does_not_follow_later_changes(self):
+        """A push that fits doesn't make a later range change jump."""
+        self.section.resize(200, 600)
+        self._settle()
+        self.section.update_stack([1, 2, 3, 4], animate=False)
+        self._settle()
+        assert self.bar.maximum() == 0
+        
+        # Shrinking the view is not a push; the view stays where it was
+        self.section.resize(200, 100)
+        self._settle()
+        assert self.bar.maximum() > 0
+        assert self.bar.value() == 0
+
+
+class TestItemRebind:
+    """Test that items rewritten in place take the new value's type."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_section(self, qapp):
+        self.section = StackSection("Data")
+        yield
+        self.section.deleteLater()
+    
+    def test_changed_item_gets_new_type(self):
+        """[0, 5] -> [5] shows 5 as a number, not the flag TRUE/FALSE."""
+        self.section.update_stack([0, 5], animate=False)
+        self.section.update_stack([5], animate=False)
+        item = self.section._items[0]
+        assert item.value_label.text() == "5"
+        assert item.value_type == 'int'
+    
+    def test_changed_item_type_across_kinds(self):
+        """[5, "hi"] -> [5, 2.5] restyles the top item as a float."""
+        self.section.update_stack([5, "hi"], animate=False)
+        self.section.update_stack([5, 2.5], animate=False)
+        item = self.section._items[1]
+        assert item.value_label.text() == "2.5"
+        assert item.value_type == 'float'